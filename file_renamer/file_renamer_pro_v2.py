@@ -15,11 +15,14 @@ Job Folder Structure:
 
 import os
 import sys
+import copy
 import logging
+import importlib.util
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Callable
 
 # Setup logging
 logging.basicConfig(
@@ -48,14 +51,8 @@ from src.widgets import (
 )
 from src.settings_dialog import SettingsDialog
 
-# Try to import drag-drop support
-try:
-    from tkinterdnd2 import TkinterDnD
-    HAS_DND = True
-    DND_INSTALL_ERROR = None
-except ImportError as e:
-    HAS_DND = False
-    DND_INSTALL_ERROR = str(e)
+# Check for drag-drop support (TkinterDnD itself is imported in main())
+HAS_DND = importlib.util.find_spec("tkinterdnd2") is not None
 
 
 def check_and_install_dnd():
@@ -190,6 +187,9 @@ class FileRenamerPro:
         self.undo_manager = UndoManager()
         self.rename_service = RenameService(self.undo_manager)
 
+        # Background worker for config file I/O
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+
         # State
         self.job_folder_path: Optional[str] = None
         self.job_info = {}
@@ -621,7 +621,7 @@ class FileRenamerPro:
 
         # Add to recent folders
         self.config.add_recent_folder(folder_path)
-        save_config(self.config, CONFIG_FILE)
+        self._save_config_async()
 
         self.detect_revisions()
         self.update_previews()
@@ -883,13 +883,33 @@ class FileRenamerPro:
         """Open settings dialog"""
         def on_settings_save(new_config: Config):
             self.config = new_config
-            save_config(self.config, CONFIG_FILE)
-            self.status_bar.set_message("Settings saved", "success")
+            self._save_config_async(on_config_saved)
+
+        def on_config_saved(saved: bool):
+            if saved:
+                self.status_bar.set_message("Settings saved", "success")
+            else:
+                self.status_bar.set_message("Could not save settings", "error")
             # Update UI with new settings
             self._refresh_after_settings()
 
         SettingsDialog(self.root, self.config, on_settings_save)
 
+    def _save_config_async(self, on_done: Optional[Callable[[bool], None]] = None):
+        """Save config on the I/O worker, then call on_done on the Tk thread"""
+        # Snapshot on the Tk thread so later edits (e.g. add_recent_folder)
+        # can't change the config while the worker serializes it
+        snapshot = copy.deepcopy(self.config)
+        future = self._io_pool.submit(save_config, snapshot, CONFIG_FILE)
+
+        def check():
+            if not future.done():
+                self.root.after(50, check)
+            elif on_done:
+                on_done(future.result())
+
+        self.root.after(50, check)
+
     def _refresh_after_settings(self):
         """Refresh UI after settings change"""
         # Update revision detector with new revisions
@@ -940,21 +960,18 @@ def main():
     if not HAS_DND:
         # Check if user wants to install it
         check_and_install_dnd()
-        # Try importing again in case it was just installed
-        try:
-            from tkinterdnd2 import TkinterDnD
-            HAS_DND = True
-        except ImportError:
-            pass
-    
-    if HAS_DND:
+
+    try:
         from tkinterdnd2 import TkinterDnD
         root = TkinterDnD.Tk()
-    else:
+        HAS_DND = True
+    except ImportError:
+        HAS_DND = False
         root = tk.Tk()
 
     app = FileRenamerPro(root)
     root.mainloop()
+    app.timer.close()
 
 
 if __name__ == "__main__":
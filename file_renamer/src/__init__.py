@@ -2,22 +2,32 @@
 File Renamer Pro - Modular Architecture
 """
 
-from .theme import Theme
-from .config import Config, load_config, save_config
-from .job_parser import JobFolderParser, JobInfo
-from .timer import TimerManager, TimeLogEntry
-from .revision import RevisionDetector
-from .services import RenameService, UndoManager, RenameSession
-from .utils import (
-    sanitize_filename, 
-    validate_filename,
-    open_folder, 
-    open_file,
-    get_platform_font,
-    ensure_directory,
-    get_unique_path,
-    parse_dropped_files,
-)
+import importlib
+
+# Public names and the submodule providing each. Submodules are imported
+# on first attribute access so importing one part doesn't load the rest.
+_LAZY_IMPORTS = {
+    'Theme': 'theme',
+    'Config': 'config',
+    'load_config': 'config',
+    'save_config': 'config',
+    'JobFolderParser': 'job_parser',
+    'JobInfo': 'job_parser',
+    'TimerManager': 'timer',
+    'TimeLogEntry': 'timer',
+    'RevisionDetector': 'revision',
+    'RenameService': 'services',
+    'UndoManager': 'services',
+    'RenameSession': 'services',
+    'sanitize_filename': 'utils',
+    'validate_filename': 'utils',
+    'open_folder': 'utils',
+    'open_file': 'utils',
+    'get_platform_font': 'utils',
+    'ensure_directory': 'utils',
+    'get_unique_path': 'utils',
+    'parse_dropped_files': 'utils',
+}
 
 __all__ = [
     'Theme',
@@ -41,3 +51,16 @@ __all__ = [
     'get_unique_path',
     'parse_dropped_files',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
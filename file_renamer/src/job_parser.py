@@ -10,6 +10,15 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# PO number in parentheses or brackets at the end of the folder name
+_PO_PATTERN = re.compile(r'[\(\[]([^\)\]]+)[\)\]]$')
+
+# Underscore-separated fields: job segment, customer, company, SKU x Qty (rest)
+_FIELDS_PATTERN = re.compile(r'((\d*)[^_]*)(?:_([^_]*))?(?:_([^_]*))?(?:_(.*))?', re.DOTALL)
+
+# SKU x Quantity
+_SKU_QTY_PATTERN = re.compile(r'(.+?)\s*[xX]\s*(\d+)')
+
 
 @dataclass
 class JobInfo:
@@ -68,32 +77,42 @@ class JobFolderParser:
         folder_name = folder_name.strip()
 
         # Try to extract PO number from end (in parentheses or brackets)
-        po_match = re.search(r'[\(\[]([^\)\]]+)[\)\]]$', folder_name)
-        if po_match:
-            result.po_number = po_match.group(1).strip()
-            folder_name = folder_name[:po_match.start()].strip('_- ')
-
-        # Split by underscores
-        parts = folder_name.split('_')
-
-        if len(parts) >= 1:
-            # First part should contain job number
-            job_match = re.match(r'^(\d+)', parts[0])
-            if job_match:
-                result.job_number = job_match.group(1)
-            else:
-                logger.warning(f"Could not extract job number from: {parts[0]}")
-
-        if len(parts) >= 2:
-            result.customer = cls._clean_name(parts[1])
-
-        if len(parts) >= 3:
-            result.company = cls._clean_name(parts[2])
-
-        if len(parts) >= 4:
+        po_number = None
+        if folder_name.endswith(')'):
+            # Fast path for the common "..._(PO#)" form
+            head, sep, tail = folder_name.rpartition('(')
+            po = tail[:-1]
+            if (sep and po and ')' not in po and ']' not in po
+                    and '(' not in head and '[' not in head):
+                po_number, folder_name = po, head
+        if po_number is None and folder_name.endswith((')', ']')):
+            po_match = _PO_PATTERN.search(folder_name)
+            if po_match:
+                po_number = po_match.group(1)
+                folder_name = folder_name[:po_match.start()]
+        if po_number is not None:
+            result.po_number = po_number.strip()
+            folder_name = folder_name.strip('_- ')
+
+        # Split into underscore-separated fields in a single match
+        job_part, job_number, customer, company, sku_qty = \
+            _FIELDS_PATTERN.fullmatch(folder_name).groups()
+
+        # First part should contain job number
+        if job_number:
+            result.job_number = job_number
+        else:
+            logger.warning(f"Could not extract job number from: {job_part}")
+
+        if customer is not None:
+            result.customer = cls._clean_name(customer)
+
+        if company is not None:
+            result.company = cls._clean_name(company)
+
+        if sku_qty is not None:
             # SKU x Quantity format
-            sku_qty = '_'.join(parts[3:])  # Join remaining parts
-            sku_match = re.match(r'(.+?)\s*[xX]\s*(\d+)', sku_qty)
+            sku_match = _SKU_QTY_PATTERN.match(sku_qty)
             if sku_match:
                 result.sku = sku_match.group(1).strip()
                 result.quantity = sku_match.group(2)
@@ -6,11 +6,21 @@ Handles automatic revision number detection and management
 import os
 import re
 import logging
+from functools import lru_cache
 from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _compile_rev_pattern(base_pattern: str, extension: str) -> re.Pattern:
+    """Compile (and cache) the regex matching base_pattern_revision.extension"""
+    return re.compile(
+        rf"^{re.escape(base_pattern)}_(\d+|FINAL){re.escape(extension)}$",
+        re.IGNORECASE
+    )
+
+
 class RevisionDetector:
     """Handles automatic revision detection based on existing files"""
 
@@ -25,6 +35,7 @@ class RevisionDetector:
             revision_list: List of valid revision values (e.g., ["1", "2", "3", "4", "5", "FINAL"])
         """
         self.revision_list = revision_list or ["1", "2", "3", "4", "5", "FINAL"]
+        self._revision_set = frozenset(self.revision_list)
 
     def find_next_revision(self, folder_path: str, base_pattern: str, 
                           extension: str = ".psd") -> str:
@@ -75,8 +86,10 @@ class RevisionDetector:
         extensions = [extension] if extension else self.DESIGN_EXTENSIONS
         all_found: set = set()
 
+        # List the folder once and match every extension against it
+        filenames = self._list_filenames(folder_path)
         for ext in extensions:
-            found = self._scan_for_revisions(folder_path, base_pattern, ext)
+            found = self._match_revisions(filenames, base_pattern, ext)
             all_found.update(found)
 
         # Sort: numeric first (ascending), then FINAL
@@ -85,26 +98,40 @@ class RevisionDetector:
     def _scan_for_revisions(self, folder_path: str, base_pattern: str, 
                            extension: str) -> List[str]:
         """Scan folder for files matching pattern and extract revisions"""
-        escaped_base = re.escape(base_pattern)
-        # Match: base_pattern_revision.extension
-        pattern = re.compile(
-            rf"^{escaped_base}_(\d+|FINAL){re.escape(extension)}$", 
-            re.IGNORECASE
-        )
+        filenames = self._list_filenames(folder_path)
+        return self._match_revisions(filenames, base_pattern, extension)
 
-        found_revisions = []
+    @staticmethod
+    def _list_filenames(folder_path: str) -> List[str]:
+        """List the names of files in a folder"""
+        filenames = []
         try:
-            for filename in os.listdir(folder_path):
-                match = pattern.match(filename)
-                if match:
-                    rev = match.group(1).upper()
-                    found_revisions.append("FINAL" if rev == "FINAL" else rev)
-                    logger.debug(f"Found existing revision: {filename} -> {rev}")
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        filenames.append(entry.name)
         except PermissionError as e:
             logger.error(f"Permission denied accessing {folder_path}: {e}")
         except OSError as e:
             logger.error(f"Error scanning directory {folder_path}: {e}")
 
+        return filenames
+
+    @staticmethod
+    def _match_revisions(filenames: List[str], base_pattern: str,
+                         extension: str) -> List[str]:
+        """Extract revisions from filenames matching the pattern"""
+        # Match: base_pattern_revision.extension
+        pattern = _compile_rev_pattern(base_pattern, extension)
+
+        found_revisions = []
+        for filename in filenames:
+            match = pattern.match(filename)
+            if match:
+                rev = match.group(1).upper()
+                found_revisions.append("FINAL" if rev == "FINAL" else rev)
+                logger.debug(f"Found existing revision: {filename} -> {rev}")
+
         return found_revisions
 
     def _get_first_revision(self) -> str:
@@ -114,19 +141,8 @@ class RevisionDetector:
     def _calculate_next_revision(self, found_revisions: List[str]) -> str:
         """Calculate the next revision based on found ones"""
         # Find max numeric revision
-        max_numeric = 0
-        has_final = False
-
-        for rev in found_revisions:
-            if rev == "FINAL":
-                has_final = True
-            else:
-                try:
-                    num = int(rev)
-                    if num > max_numeric:
-                        max_numeric = num
-                except ValueError:
-                    pass
+        max_numeric = max((int(r) for r in found_revisions if r.isdigit()), default=0)
+        has_final = "FINAL" in found_revisions
 
         # If FINAL exists, suggest FINAL again (or ask user)
         if has_final:
@@ -136,11 +152,11 @@ class RevisionDetector:
         next_rev = str(max_numeric + 1)
 
         # Check if next revision is in our list
-        if next_rev in self.revision_list:
+        if next_rev in self._revision_set:
             return next_rev
 
         # If we've exceeded the numeric revisions, suggest FINAL
-        if "FINAL" in self.revision_list and max_numeric >= 5:
+        if "FINAL" in self._revision_set and max_numeric >= 5:
             return "FINAL"
 
         # Otherwise return the calculated next
@@ -148,7 +164,7 @@ class RevisionDetector:
 
     def is_valid_revision(self, revision: str) -> bool:
         """Check if a revision value is valid"""
-        return revision in self.revision_list or revision.isdigit()
+        return revision in self._revision_set or revision.isdigit()
 
     def parse_revision_from_filename(self, filename: str) -> Optional[str]:
         """
@@ -4,13 +4,16 @@ Business logic for file operations, undo/redo, etc.
 """
 
 import os
-import shutil
+import stat
 import logging
 import threading
-from pathlib import Path
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Tuple, Set
 from datetime import datetime
+from functools import lru_cache
 from enum import Enum
 
 from .utils import sanitize_filename, get_unique_path, ensure_directory
@@ -18,6 +21,99 @@ from .utils import sanitize_filename, get_unique_path, ensure_directory
 logger = logging.getLogger(__name__)
 
 
+def _stat_path(path: str) -> Tuple[bool, bool, bool]:
+    """Get (exists, is_file, readable) for a path from a single lstat call"""
+    try:
+        st = os.lstat(path)
+        if stat.S_ISLNK(st.st_mode):
+            # Only symlinks need a second stat to resolve their target
+            st = os.stat(path)
+    except (OSError, ValueError):
+        return False, False, False
+    is_file = stat.S_ISREG(st.st_mode)
+    return True, is_file, is_file and os.access(path, os.R_OK)
+
+
+# Progress callbacks fire for at most ~200 evenly spaced files per batch,
+# plus whenever this many seconds have passed since the last one
+_PROGRESS_STEPS = 200
+_PROGRESS_INTERVAL = 0.05
+
+
+def _throttle_progress(on_progress: Callable[[int, int, str], None],
+                       total: int) -> Callable[[int, int, str], None]:
+    """
+    Wrap a progress callback so large batches don't flood the UI with
+    one update per file. The final (total, total, name) call always fires.
+    """
+    stride = max(1, total // _PROGRESS_STEPS)
+    last_i = 0
+    last_time = time.monotonic()
+
+    def throttled(i: int, total: int, name: str) -> None:
+        nonlocal last_i, last_time
+        now = time.monotonic()
+        if i >= total or i - last_i >= stride or now - last_time > _PROGRESS_INTERVAL:
+            last_i = i
+            last_time = now
+            on_progress(i, total, name)
+
+    return throttled
+
+
+def _existing_names(folder: str) -> Optional[Set[str]]:
+    """
+    List a folder once and return the casefolded names it contains,
+    or None if it can't be read.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name.casefold() for entry in entries}
+    except OSError as e:
+        logger.debug(f"Could not list {folder}: {e}")
+        return None
+
+
+def _get_device(folder: str, dev_cache: Dict[str, int]) -> int:
+    """Get (and cache) the filesystem device id of a folder"""
+    dev = dev_cache.get(folder)
+    if dev is None:
+        dev = dev_cache[folder] = os.stat(folder or os.curdir).st_dev
+    return dev
+
+
+def _move_file(src: str, dst: str, dev_cache: Dict[str, int]) -> None:
+    """
+    Move a file, renaming it in place when source and destination are on
+    the same filesystem and falling back to shutil.move otherwise.
+
+    Args:
+        src: Source file path
+        dst: Destination file path (replaced if it exists)
+        dev_cache: Folder -> device id cache shared across a batch
+    """
+    src_dev = _get_device(os.path.dirname(src), dev_cache)
+    dst_dev = _get_device(os.path.dirname(dst), dev_cache)
+    if src_dev == dst_dev:
+        os.replace(src, dst)
+    else:
+        import shutil  # Only needed for cross-device moves
+        shutil.move(src, dst)
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """
+    Copy a file's contents and metadata.
+
+    shutil.copyfile uses the kernel copy fast paths (sendfile on Linux,
+    fcopyfile on macOS) for the data; copystat then preserves timestamps
+    and permission bits like shutil.copy2.
+    """
+    import shutil  # Deferred: shutil is slow to import and copies are rare
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
 class FileOperation(Enum):
     """Types of file operations"""
     MOVE = "move"
@@ -25,16 +121,76 @@ class FileOperation(Enum):
     RENAME = "rename"
 
 
-@dataclass
+def _split_path(path: str) -> Tuple[str, str]:
+    """Split a path into (folder prefix including its trailing separator, name)"""
+    i = path.rfind(os.sep)
+    if os.altsep:
+        i = max(i, path.rfind(os.altsep))
+    return path[:i + 1], path[i + 1:]
+
+
+@lru_cache(maxsize=256)
+def _build_stem(job_number: str, sku: str, artwork_ref: str, purpose: str,
+                revision: str) -> str:
+    """Build (and cache) the sanitized filename stem shared by a batch"""
+    parts = []
+    if job_number:
+        parts.append(sanitize_filename(job_number))
+    if sku:
+        parts.append(sanitize_filename(sku))
+    if artwork_ref:
+        # Wrap in parentheses
+        sanitized_ref = sanitize_filename(artwork_ref)
+        parts.append(f"({sanitized_ref})")
+    if purpose:
+        parts.append(sanitize_filename(purpose))
+    if revision:
+        parts.append(sanitize_filename(revision))
+    return "_".join(parts)
+
+
+@dataclass(slots=True)
 class RenameRecord:
-    """Record of a single file rename operation"""
-    original_path: str
-    new_path: str
+    """
+    Record of a single file rename operation.
+
+    Paths are stored as folder prefix + file name so records created
+    through a session share one string per folder.
+    """
+    original_dir: str
+    original_name: str
+    new_dir: str
+    new_name: str
     operation: FileOperation
     timestamp: str
     success: bool = True
     error: str = ""
 
+    @classmethod
+    def from_paths(cls, original_path: str, new_path: str, operation: FileOperation,
+                   timestamp: str, dir_pool: Optional[Dict[str, str]] = None) -> 'RenameRecord':
+        """Create a record from full paths, sharing folder strings via dir_pool"""
+        original_dir, original_name = _split_path(original_path)
+        new_dir, new_name = _split_path(new_path)
+        if dir_pool is not None:
+            original_dir = dir_pool.setdefault(original_dir, original_dir)
+            new_dir = dir_pool.setdefault(new_dir, new_dir)
+        return cls(original_dir, original_name, new_dir, new_name, operation, timestamp)
+
+    @property
+    def original_path(self) -> str:
+        return self.original_dir + self.original_name
+
+    @property
+    def new_path(self) -> str:
+        return self.new_dir + self.new_name
+
+    @new_path.setter
+    def new_path(self, path: str) -> None:
+        new_dir, self.new_name = _split_path(path)
+        if new_dir != self.new_dir:
+            self.new_dir = new_dir
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'original_path': self.original_path,
@@ -46,25 +202,47 @@ class RenameRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RenameSession:
     """A batch of rename operations that can be undone together"""
     id: str
     records: List[RenameRecord] = field(default_factory=list)
     timestamp: str = ""
     job_number: str = ""
+    # Folder prefix strings shared by this session's records
+    _dir_pool: Dict[str, str] = field(default_factory=dict, repr=False, compare=False)
+    # Running totals kept up to date by add_record
+    _success_count: int = field(default=0, init=False, repr=False, compare=False)
+    _error_count: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.timestamp:
             self.timestamp = datetime.now().isoformat()
+        self._success_count = sum(1 for r in self.records if r.success)
+        self._error_count = len(self.records) - self._success_count
+
+    def add_record(self, record: RenameRecord) -> None:
+        """Append a finished record and update the counters"""
+        self.records.append(record)
+        if record.success:
+            self._success_count += 1
+        else:
+            self._error_count += 1
+
+    def add_records(self, records: List[RenameRecord]) -> None:
+        """Append a list of finished records in one step and update the counters"""
+        self.records.extend(records)
+        succeeded = sum(1 for r in records if r.success)
+        self._success_count += succeeded
+        self._error_count += len(records) - succeeded
 
     @property
     def success_count(self) -> int:
-        return sum(1 for r in self.records if r.success)
+        return self._success_count
 
     @property
     def error_count(self) -> int:
-        return sum(1 for r in self.records if not r.success)
+        return self._error_count
 
 
 class UndoManager:
@@ -72,19 +250,21 @@ class UndoManager:
 
     def __init__(self, max_history: int = 50):
         self.max_history = max_history
-        self._undo_stack: List[RenameSession] = []
-        self._redo_stack: List[RenameSession] = []
+        # Bounded stacks: appending past max_history drops the oldest session
+        self._undo_stack: deque[RenameSession] = deque(maxlen=max_history)
+        self._redo_stack: deque[RenameSession] = deque(maxlen=max_history)
         self._lock = threading.Lock()
+        # Bumped by record_session so an undo/redo running without the lock
+        # can tell that a new action happened meanwhile
+        self._generation = 0
 
     def record_session(self, session: RenameSession) -> None:
         """Record a rename session for potential undo"""
         with self._lock:
+            self._generation += 1
             self._undo_stack.append(session)
             # Clear redo stack when new action is performed
             self._redo_stack.clear()
-            # Trim history if needed
-            while len(self._undo_stack) > self.max_history:
-                self._undo_stack.pop(0)
             logger.info(f"Recorded session {session.id} with {len(session.records)} operations")
 
     def can_undo(self) -> bool:
@@ -107,37 +287,50 @@ class UndoManager:
                 return False, "Nothing to undo", 0
 
             session = self._undo_stack.pop()
-            restored = 0
-            errors = []
-
-            # Process in reverse order
-            for record in reversed(session.records):
-                if not record.success:
-                    continue  # Skip failed operations
-
-                try:
-                    if Path(record.new_path).exists():
-                        if record.operation == FileOperation.MOVE:
-                            # Move back to original location
-                            original_dir = Path(record.original_path).parent
+            generation = self._generation
+
+        # The lock only guards the stacks; file operations run without it
+        restored = 0
+        errors = []
+        dev_cache: Dict[str, int] = {}
+        ensured_dirs = set()
+
+        # Process in reverse order
+        for record in reversed(session.records):
+            if not record.success:
+                continue  # Skip failed operations
+
+            np = record.new_path
+            try:
+                if os.path.lexists(np):
+                    if record.operation == FileOperation.MOVE:
+                        # Move back to original location
+                        original_dir = record.original_dir or os.curdir
+                        if original_dir not in ensured_dirs:
                             ensure_directory(original_dir)
-                            shutil.move(record.new_path, record.original_path)
-                        elif record.operation == FileOperation.COPY:
-                            # Delete the copy
-                            os.remove(record.new_path)
-                        restored += 1
-                    else:
-                        errors.append(f"File not found: {record.new_path}")
-                except Exception as e:
-                    errors.append(f"{Path(record.new_path).name}: {str(e)}")
-                    logger.error(f"Undo failed for {record.new_path}: {e}")
-
-            # Add to redo stack
-            self._redo_stack.append(session)
-
-            if errors:
-                return False, f"Restored {restored} files with {len(errors)} errors", restored
-            return True, f"Restored {restored} files", restored
+                            ensured_dirs.add(original_dir)
+                        _move_file(np, record.original_path, dev_cache)
+                    elif record.operation == FileOperation.COPY:
+                        # Delete the copy
+                        os.remove(np)
+                    restored += 1
+                else:
+                    errors.append(f"File not found: {np}")
+            except Exception as e:
+                errors.append(f"{record.new_name}: {str(e)}")
+                logger.error(f"Undo failed for {np}: {e}")
+
+        # Add to redo stack, unless a new action was recorded meanwhile:
+        # that cleared redo, and this older session must not come back
+        with self._lock:
+            if self._generation == generation:
+                self._redo_stack.append(session)
+            else:
+                logger.info(f"Session {session.id} not added to redo: newer action recorded")
+
+        if errors:
+            return False, f"Restored {restored} files with {len(errors)} errors", restored
+        return True, f"Restored {restored} files", restored
 
     def redo(self) -> tuple[bool, str, int]:
         """
@@ -151,33 +344,48 @@ class UndoManager:
                 return False, "Nothing to redo", 0
 
             session = self._redo_stack.pop()
-            renamed = 0
-            errors = []
+            generation = self._generation
+
+        renamed = 0
+        errors = []
+        dev_cache: Dict[str, int] = {}
+        ensured_dirs = set()
 
-            for record in session.records:
-                if not record.success:
-                    continue
+        for record in session.records:
+            if not record.success:
+                continue
 
-                try:
-                    if Path(record.original_path).exists():
-                        dest_dir = Path(record.new_path).parent
+            op = record.original_path
+            try:
+                if os.path.lexists(op):
+                    dest_dir = record.new_dir or os.curdir
+                    if dest_dir not in ensured_dirs:
                         ensure_directory(dest_dir)
-                        if record.operation == FileOperation.MOVE:
-                            shutil.move(record.original_path, record.new_path)
-                        elif record.operation == FileOperation.COPY:
-                            shutil.copy2(record.original_path, record.new_path)
-                        renamed += 1
-                    else:
-                        errors.append(f"File not found: {record.original_path}")
-                except Exception as e:
-                    errors.append(str(e))
-
-            # Add back to undo stack
-            self._undo_stack.append(session)
+                        ensured_dirs.add(dest_dir)
+                    if record.operation == FileOperation.MOVE:
+                        _move_file(op, record.new_path, dev_cache)
+                    elif record.operation == FileOperation.COPY:
+                        _copy_file(op, record.new_path)
+                    renamed += 1
+                else:
+                    errors.append(f"File not found: {op}")
+            except Exception as e:
+                errors.append(str(e))
 
-            if errors:
-                return False, f"Renamed {renamed} files with {len(errors)} errors", renamed
-            return True, f"Renamed {renamed} files", renamed
+        # Add back to undo stack, below any sessions recorded meanwhile so
+        # those are still undone first
+        with self._lock:
+            newer = self._generation - generation
+            stack = self._undo_stack
+            index = len(stack) - newer
+            if newer and len(stack) == stack.maxlen:
+                stack.popleft()  # insert() can't drop the oldest like append()
+                index -= 1
+            stack.insert(max(0, index), session)
+
+        if errors:
+            return False, f"Renamed {renamed} files with {len(errors)} errors", renamed
+        return True, f"Renamed {renamed} files", renamed
 
     def get_undo_description(self) -> str:
         """Get description of what will be undone"""
@@ -203,6 +411,9 @@ class UndoManager:
 class RenameService:
     """Service for handling file rename operations"""
 
+    # Shared worker threads for rename_files_async
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rename")
+
     def __init__(self, undo_manager: Optional[UndoManager] = None):
         self.undo_manager = undo_manager or UndoManager()
         self._lock = threading.Lock()
@@ -225,31 +436,17 @@ class RenameService:
         Returns:
             Generated filename
         """
-        _, ext = os.path.splitext(original_path)
-        ext = ext.lower()
-
-        parts = []
-        if job_number:
-            parts.append(sanitize_filename(job_number))
-        if sku:
-            parts.append(sanitize_filename(sku))
-        if artwork_ref:
-            # Wrap in parentheses
-            sanitized_ref = sanitize_filename(artwork_ref)
-            parts.append(f"({sanitized_ref})")
-        if purpose:
-            parts.append(sanitize_filename(purpose))
-        if revision:
-            parts.append(sanitize_filename(revision))
-
-        if not parts:
+        stem = _build_stem(job_number, sku, artwork_ref, purpose, revision)
+        if not stem:
             return os.path.basename(original_path)
 
-        return "_".join(parts) + ext
+        _, ext = os.path.splitext(original_path)
+        return stem + ext.lower()
 
     def rename_files(self, files: List[dict], dest_folder: str, job_number: str,
                     on_progress: Optional[Callable[[int, int, str], None]] = None,
-                    duplicate_mode: str = "skip") -> RenameSession:
+                    duplicate_mode: str = "skip",
+                    pre_validated: bool = False) -> RenameSession:
         """
         Rename and move a batch of files.
         
@@ -259,92 +456,213 @@ class RenameService:
             job_number: Job number for logging
             on_progress: Callback for progress updates (current, total, filename)
             duplicate_mode: How to handle duplicates: skip, increment, overwrite
+            pre_validated: Skip the per-file source check when the caller
+                already ran validate_files
             
         Returns:
             RenameSession with results
         """
+        # One timestamp for the whole batch, shared by every record
+        now = datetime.now()
         session = RenameSession(
-            id=datetime.now().strftime("%Y%m%d_%H%M%S"),
+            id=now.strftime("%Y%m%d_%H%M%S"),
+            timestamp=now.isoformat(),
             job_number=job_number,
         )
 
-        ensure_directory(Path(dest_folder))
+        ensure_directory(dest_folder)
         total = len(files)
+        dev_cache: Dict[str, int] = {}
+        if on_progress:
+            on_progress = _throttle_progress(on_progress, total)
+
+        # Moves can run concurrently unless two files could end up at the
+        # same destination (repeated names, or names generated by increment),
+        # or one file's destination is another's source: the parallel path
+        # resolves every duplicate before any move, so that case has to run
+        # one file at a time like the serial path
+        parallel = (total > 1 and duplicate_mode != "increment" and
+                    len({f['new_name'].casefold() for f in files}) == total)
+        if parallel:
+            abspath = os.path.abspath
+            sources = {abspath(f['path']).casefold() for f in files}
+            parallel = sources.isdisjoint(
+                abspath(os.path.join(dest_folder, f['new_name'])).casefold() for f in files)
+
+        validate = not pre_validated
+        # Names already in the destination, read with a single scandir
+        existing = _existing_names(dest_folder)
+        if parallel:
+            self._rename_parallel(session, files, dest_folder, duplicate_mode,
+                                  validate, existing, dev_cache, on_progress)
+        else:
+            self._rename_serial(session, files, dest_folder, duplicate_mode,
+                                validate, existing, dev_cache, on_progress)
 
+        # Record for undo
+        if session.success_count > 0:
+            self.undo_manager.record_session(session)
+
+        return session
+
+    def _rename_serial(self, session: RenameSession, files: List[dict], dest_folder: str,
+                       duplicate_mode: str, validate: bool, existing: Optional[Set[str]],
+                       dev_cache: Dict[str, int],
+                       on_progress: Optional[Callable[[int, int, str], None]]) -> None:
+        """Rename files one after another"""
+        total = len(files)
+        records: List[Optional[RenameRecord]] = [None] * total
         for i, file_info in enumerate(files):
-            original_path = file_info['path']
             new_name = file_info['new_name']
             new_path = os.path.join(dest_folder, new_name)
 
             if on_progress:
                 on_progress(i + 1, total, new_name)
 
-            record = RenameRecord(
-                original_path=original_path,
-                new_path=new_path,
-                operation=FileOperation.MOVE,
-                timestamp=datetime.now().isoformat(),
-            )
-
-            try:
-                # Handle duplicates
-                if os.path.exists(new_path):
-                    if duplicate_mode == "skip":
-                        record.success = False
-                        record.error = "File already exists"
-                        session.records.append(record)
-                        continue
-                    elif duplicate_mode == "increment":
-                        new_path = str(get_unique_path(Path(new_path)))
-                        record.new_path = new_path
-                    elif duplicate_mode == "overwrite":
-                        os.remove(new_path)
-
-                # Perform the move
-                shutil.move(original_path, new_path)
-                record.success = True
-                logger.info(f"Renamed: {original_path} -> {new_path}")
-
-            except PermissionError as e:
-                record.success = False
-                record.error = "Permission denied"
-                logger.error(f"Permission denied: {original_path}: {e}")
-            except FileNotFoundError as e:
-                record.success = False
-                record.error = "Source file not found"
-                logger.error(f"File not found: {original_path}: {e}")
-            except Exception as e:
-                record.success = False
-                record.error = str(e)
-                logger.error(f"Error renaming {original_path}: {e}")
+            record, should_move = self._prepare_record(session, file_info['path'], new_path,
+                                                       duplicate_mode, validate, existing)
+            if should_move:
+                self._move_record(record, dev_cache)
+                if record.success and existing is not None:
+                    existing.add(record.new_name.casefold())
+            records[i] = record
+
+        session.add_records(records)
+
+    def _rename_parallel(self, session: RenameSession, files: List[dict], dest_folder: str,
+                         duplicate_mode: str, validate: bool, existing: Optional[Set[str]],
+                         dev_cache: Dict[str, int],
+                         on_progress: Optional[Callable[[int, int, str], None]]) -> None:
+        """Resolve duplicates serially, then run the moves on a thread pool"""
+        total = len(files)
+        prepared = [
+            self._prepare_record(session, f['path'],
+                                 os.path.join(dest_folder, f['new_name']), duplicate_mode,
+                                 validate, existing)
+            for f in files
+        ]
+
+        done = 0
+        with ThreadPoolExecutor(max_workers=min(32, total)) as pool:
+            futures = []
+            for record, should_move in prepared:
+                if should_move:
+                    futures.append(pool.submit(self._move_record, record, dev_cache))
+                else:
+                    done += 1
+                    if on_progress:
+                        on_progress(done, total, os.path.basename(record.new_path))
+
+            # Progress is reported from the calling thread as moves finish
+            for future in as_completed(futures):
+                record = future.result()
+                done += 1
+                if on_progress:
+                    on_progress(done, total, os.path.basename(record.new_path))
+
+        # Add records in input order once every move has finished
+        session.add_records([record for record, _ in prepared])
+
+    def _prepare_record(self, session: RenameSession, original_path: str, new_path: str,
+                        duplicate_mode: str, validate: bool,
+                        existing: Optional[Set[str]]) -> Tuple[RenameRecord, bool]:
+        """
+        Create the record for one file, check its source and resolve duplicates.
 
-            session.records.append(record)
+        existing is the destination's casefolded name set; a name missing from
+        it can't be a duplicate, so only matches are confirmed with a stat.
 
-        # Record for undo
-        if session.success_count > 0:
-            self.undo_manager.record_session(session)
+        Returns:
+            Tuple of (record, should_move)
+        """
+        record = RenameRecord.from_paths(
+            original_path,
+            new_path,
+            FileOperation.MOVE,
+            session.timestamp,
+            session._dir_pool,
+        )
 
-        return session
+        if validate:
+            error = self._source_error(original_path)
+            if error:
+                record.success = False
+                record.error = error
+                return record, False
+
+        try:
+            # Handle duplicates
+            maybe_exists = existing is None or record.new_name.casefold() in existing
+            if maybe_exists and _stat_path(new_path)[0]:
+                if duplicate_mode == "skip":
+                    record.success = False
+                    record.error = "File already exists"
+                    return record, False
+                elif duplicate_mode == "increment":
+                    from pathlib import Path
+                    record.new_path = str(get_unique_path(Path(new_path)))
+                elif duplicate_mode == "overwrite":
+                    os.remove(new_path)
+        except Exception as e:
+            self._set_record_error(record, e)
+            return record, False
+
+        return record, True
+
+    def _move_record(self, record: RenameRecord, dev_cache: Dict[str, int]) -> RenameRecord:
+        """Perform the move for a prepared record"""
+        try:
+            _move_file(record.original_path, record.new_path, dev_cache)
+            record.success = True
+            logger.info(f"Renamed: {record.original_path} -> {record.new_path}")
+        except Exception as e:
+            self._set_record_error(record, e)
+
+        return record
+
+    @staticmethod
+    def _source_error(path: str) -> str:
+        """Check a source file with one stat; returns an error message or ''"""
+        exists, is_file, readable = _stat_path(path)
+        if not exists:
+            return "Source file not found"
+        if not is_file:
+            return "Not a file"
+        if not readable:
+            return "File not readable"
+        return ""
+
+    @staticmethod
+    def _set_record_error(record: RenameRecord, error: Exception) -> None:
+        """Mark a record as failed with a user-facing error message"""
+        record.success = False
+        if isinstance(error, PermissionError):
+            record.error = "Permission denied"
+            logger.error(f"Permission denied: {record.original_path}: {error}")
+        elif isinstance(error, FileNotFoundError):
+            record.error = "Source file not found"
+            logger.error(f"File not found: {record.original_path}: {error}")
+        else:
+            record.error = str(error)
+            logger.error(f"Error renaming {record.original_path}: {error}")
 
     def rename_files_async(self, files: List[dict], dest_folder: str, job_number: str,
                           on_progress: Optional[Callable[[int, int, str], None]] = None,
                           on_complete: Optional[Callable[[RenameSession], None]] = None,
-                          duplicate_mode: str = "skip") -> threading.Thread:
+                          duplicate_mode: str = "skip",
+                          pre_validated: bool = False) -> Future:
         """
-        Rename files in a background thread.
+        Rename files on a background worker thread.
         
         Returns:
-            The thread object (already started)
+            Future resolving to the RenameSession; on_complete, if given,
+            is called with the session when it finishes
         """
-        def worker():
-            session = self.rename_files(files, dest_folder, job_number, 
-                                       on_progress, duplicate_mode)
-            if on_complete:
-                on_complete(session)
-
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
-        return thread
+        future = self._executor.submit(self.rename_files, files, dest_folder, job_number,
+                                       on_progress, duplicate_mode, pre_validated)
+        if on_complete:
+            future.add_done_callback(lambda f: on_complete(f.result()))
+        return future
 
     def validate_files(self, files: List[str]) -> List[tuple[str, bool, str]]:
         """
@@ -355,11 +673,13 @@ class RenameService:
         """
         results = []
         for path in files:
-            if not os.path.exists(path):
+            # Always a fresh stat: files may change between validations
+            exists, is_file, readable = _stat_path(path)
+            if not exists:
                 results.append((path, False, "File not found"))
-            elif not os.path.isfile(path):
+            elif not is_file:
                 results.append((path, False, "Not a file"))
-            elif not os.access(path, os.R_OK):
+            elif not readable:
                 results.append((path, False, "File not readable"))
             else:
                 results.append((path, True, ""))
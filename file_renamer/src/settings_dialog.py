@@ -11,6 +11,27 @@ from .theme import Theme
 from .config import Config
 from .widgets import StyledButton, StyledEntry
 
+# ttk styles are global to the Tk interpreter, so they only need configuring once
+_styles_done = False
+
+
+def _ensure_styles_configured():
+    """Configure the settings dialog ttk styles on first use"""
+    global _styles_done
+    if _styles_done:
+        return
+
+    style = ttk.Style()
+    style.configure("Dark.TNotebook", background=Theme.BG_PRIMARY)
+    style.configure("Dark.TNotebook.Tab", 
+                   background=Theme.BG_SECONDARY, 
+                   foreground=Theme.TEXT_PRIMARY,
+                   padding=[12, 6])
+    style.map("Dark.TNotebook.Tab",
+             background=[("selected", Theme.BG_TERTIARY)],
+             foreground=[("selected", Theme.ACCENT_PRIMARY)])
+    _styles_done = True
+
 
 class SettingsDialog(tk.Toplevel):
     """Settings dialog window for editing configuration"""
@@ -37,6 +58,7 @@ class SettingsDialog(tk.Toplevel):
         y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
         self.geometry(f"+{x}+{y}")
 
+        _ensure_styles_configured()
         self._setup_ui()
 
     def _setup_ui(self):
@@ -46,16 +68,6 @@ class SettingsDialog(tk.Toplevel):
         main_frame.pack(fill="both", expand=True, padx=Theme.PAD_LG, pady=Theme.PAD_LG)
 
         # Create notebook for tabs
-        style = ttk.Style()
-        style.configure("Dark.TNotebook", background=Theme.BG_PRIMARY)
-        style.configure("Dark.TNotebook.Tab", 
-                       background=Theme.BG_SECONDARY, 
-                       foreground=Theme.TEXT_PRIMARY,
-                       padding=[12, 6])
-        style.map("Dark.TNotebook.Tab",
-                 background=[("selected", Theme.BG_TERTIARY)],
-                 foreground=[("selected", Theme.ACCENT_PRIMARY)])
-
         self.notebook = ttk.Notebook(main_frame, style="Dark.TNotebook")
         self.notebook.pack(fill="both", expand=True)
 
@@ -278,8 +290,8 @@ class SettingsDialog(tk.Toplevel):
 
     def _text_to_list(self, text_widget: tk.Text) -> list:
         """Convert text widget content to list"""
-        content = text_widget.get("1.0", tk.END)
-        return [line.strip() for line in content.split("\n") if line.strip()]
+        lines = text_widget.get("1.0", tk.END).splitlines()
+        return [line for line in map(str.strip, lines) if line]
 
     def _on_save(self):
         """Save settings"""
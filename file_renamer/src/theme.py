@@ -4,10 +4,14 @@ Creative Studio Dark Theme with cross-platform font support
 """
 
 import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
 
+@lru_cache(maxsize=None)
 def get_platform_fonts():
-    """Get appropriate fonts for the current platform"""
+    """Get appropriate fonts for the current platform (computed once per process)"""
     if sys.platform == 'darwin':  # macOS
         return {
             'display': ('SF Pro Display', 'Helvetica Neue', 'Arial'),
@@ -28,6 +32,23 @@ def get_platform_fonts():
         }
 
 
+@lru_cache(maxsize=16)
+def _make_lut(factor: float) -> bytes:
+    """Lookup table mapping each 0-255 channel value to its scaled value"""
+    return bytes(min(255, int(c * factor)) for c in range(256))
+
+
+@lru_cache(maxsize=64)
+def _color_variants(base_color: str, disabled_color: str) -> Mapping[str, str]:
+    """Build (and cache) the read-only variants mapping for a base color"""
+    return MappingProxyType({
+        'normal': base_color,
+        # Simple brightening for hover
+        'hover': Theme._adjust_brightness(base_color, 1.15),
+        'disabled': disabled_color,
+    })
+
+
 class Theme:
     """Design tokens for the Creative Studio aesthetic"""
 
@@ -86,19 +107,12 @@ class Theme:
     TOOLTIP_DELAY = 500  # ms
 
     @classmethod
-    def get_color_variants(cls, base_color: str) -> dict:
-        """Generate hover and disabled variants of a color"""
-        # Simple brightening for hover
-        return {
-            'normal': base_color,
-            'hover': cls._adjust_brightness(base_color, 1.15),
-            'disabled': cls.BG_TERTIARY,
-        }
+    def get_color_variants(cls, base_color: str) -> Mapping[str, str]:
+        """Get hover and disabled variants of a color (cached, read-only)"""
+        return _color_variants(base_color, cls.BG_TERTIARY)
 
     @staticmethod
     def _adjust_brightness(hex_color: str, factor: float) -> str:
         """Adjust the brightness of a hex color"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        new_rgb = tuple(min(255, int(c * factor)) for c in rgb)
-        return f"#{new_rgb[0]:02x}{new_rgb[1]:02x}{new_rgb[2]:02x}"
+        raw = bytes.fromhex(hex_color.lstrip('#'))
+        return '#' + raw.translate(_make_lut(factor)).hex()
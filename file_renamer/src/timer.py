@@ -3,17 +3,93 @@ Timer Manager for File Renamer Pro
 Handles clock in/out functionality and time logging
 """
 
+import os
 import json
+import time
+import queue
+import atexit
 import logging
-from datetime import datetime
+import threading
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, List, Iterator
+from dataclasses import dataclass
+
+# orjson is optional - it serializes log entries straight to bytes
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment"""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={raw!r}, using {default}")
+        return default
+
+
+# The background writer collects up to this many log entries, or waits this
+# long for more after the first one, before writing them together
+BATCH_SIZE = _env_int("TIMER_BATCH_SIZE", 10)
+BATCH_MS = _env_int("TIMER_BATCH_MS", 500)
+
+
+if HAS_ORJSON:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    _loads = json.loads
+
+
+def _to_json_line(data: Dict[str, Any]) -> bytes:
+    """Serialize one log entry as a compact UTF-8 JSON line"""
+    return _dumps(data) + b'\n'
+
+# Queue markers asking the log writer to write what it has right away,
+# and additionally to exit afterwards
+_FLUSH = object()
+_STOP = object()
+
+
+def _format_hms(total: int) -> str:
+    """Format whole seconds as HH:MM:SS"""
+    return '%02d:%02d:%02d' % (total // 3600, total // 60 % 60, total % 60)
+
+
+def _read_log_lines(log_file: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the entries of a JSON Lines log.
+
+    Lines that can't be parsed (e.g. a write cut short by a crash) are
+    skipped so the rest of the day's log stays readable.
+    """
+    with open(log_file, 'rb') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                data = _loads(line)
+            except ValueError as e:
+                logger.warning(f"Skipping bad line {line_no} in {log_file}: {e}")
+                continue
+            if isinstance(data, dict):
+                yield data
+            else:
+                logger.warning(f"Skipping bad line {line_no} in {log_file}: not an object")
+
+
+@dataclass(slots=True)
 class TimeLogEntry:
     """A single time log entry"""
     job_number: str
@@ -26,7 +102,16 @@ class TimeLogEntry:
     notes: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'job_number': self.job_number,
+            'job_folder': self.job_folder,
+            'clock_in': self.clock_in,
+            'clock_out': self.clock_out,
+            'duration_minutes': self.duration_minutes,
+            'date': self.date,
+            'files_renamed': self.files_renamed,
+            'notes': self.notes,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TimeLogEntry':
@@ -46,7 +131,7 @@ class TimerManager:
     """Manages the clock in/out timer functionality"""
 
     def __init__(self, log_dir: Path):
-        self.log_dir = Path(log_dir)
+        self.log_dir = log_dir if isinstance(log_dir, Path) else Path(log_dir)
         self._ensure_log_dir()
         
         self.is_clocked_in: bool = False
@@ -54,6 +139,35 @@ class TimerManager:
         self.current_job: Optional[str] = None
         self.current_job_folder: Optional[str] = None
         self.files_renamed: int = 0
+        # Monotonic clock reading at clock in, used for elapsed time
+        self._mono_in: float = 0.0
+
+        # Log entries are written by a background thread so clock out
+        # doesn't wait on the disk
+        self._queue: queue.Queue = queue.Queue()
+        self._io_lock = threading.Lock()
+        # Dates whose older JSON-array log has already been checked
+        self._migrated: set = set()
+        # Parsed entries per date, keyed by the file's (mtime_ns, size)
+        self._entry_cache: Dict[str, tuple[tuple[int, int], List[TimeLogEntry]]] = {}
+        # Log path for the most recently used date (normally today)
+        self._today: str = ''
+        self._today_path: Optional[Path] = None
+        # Set by the writer when a write fails; reported (and reset) by _flush
+        self._write_failed = False
+        self._writer: Optional[threading.Thread] = threading.Thread(
+            target=self._writer_loop, name="timelog-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self._flush)
+
+    def close(self) -> None:
+        """Write any queued log entries and stop the background writer"""
+        if self._writer is None:
+            return
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._writer = None
+        atexit.unregister(self._flush)
 
     def _ensure_log_dir(self) -> None:
         """Ensure log directory exists"""
@@ -84,6 +198,7 @@ class TimerManager:
 
         self.is_clocked_in = True
         self.clock_in_time = datetime.now()
+        self._mono_in = time.monotonic()
         self.current_job = job_number
         self.current_job_folder = job_folder
         self.files_renamed = 0
@@ -128,12 +243,10 @@ class TimerManager:
         )
 
         # Save to file
-        self._save_log_entry(log_entry)
+        saved = self._save_log_entry(log_entry)
 
         # Format duration string
-        hours, remainder = divmod(int(duration.total_seconds()), 3600)
-        minutes, seconds = divmod(remainder, 60)
-        duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        duration_str = _format_hms(int(duration.total_seconds()))
 
         # Reset state
         self.is_clocked_in = False
@@ -143,41 +256,150 @@ class TimerManager:
         self.current_job_folder = None
 
         logger.info(f"Clocked out from job {job_number}. Duration: {duration_str}")
-        return True, f"Clocked out! Session: {duration_str}", log_entry
+        message = f"Clocked out! Session: {duration_str}"
+        if not saved:
+            message += " (time log could not be saved)"
+        return True, message, log_entry
 
     def _save_log_entry(self, entry: TimeLogEntry) -> bool:
-        """Save a log entry to the daily log file"""
-        log_file = self.log_dir / f"timelog_{entry.date}.json"
-        entries: List[Dict[str, Any]] = []
+        """
+        Write a log entry now (together with anything already queued).
+
+        Returns:
+            True if the entry and the queued entries were saved
+        """
+        if self._writer is None:
+            # Closed: nothing would drain the queue, so write directly
+            return self._write_entries(entry.date, [entry.to_dict()])
+        self._queue.put(entry.to_dict())
+        return self._flush()
+
+    def _queue_log_entry(self, entry: TimeLogEntry) -> None:
+        """Queue a log entry to be written with the next batch; failures are reported by _flush"""
+        if self._writer is None:
+            self._save_log_entry(entry)
+            return
+        self._queue.put(entry.to_dict())
+
+    def _flush(self) -> bool:
+        """
+        Wait until every queued log entry has been written.
+
+        Returns:
+            False if any write failed since the last flush
+        """
+        if self._queue.unfinished_tasks:
+            # Wake the writer so it doesn't wait out the batch window
+            self._queue.put(_FLUSH)
+            self._queue.join()
+        failed, self._write_failed = self._write_failed, False
+        return not failed
+
+    def _writer_loop(self) -> None:
+        """Background thread: write queued entries in batches until stopped"""
+        while True:
+            item = self._queue.get()
+            batch = []
+            if item is not _FLUSH and item is not _STOP:
+                batch.append(item)
+                deadline = time.monotonic() + BATCH_MS / 1000
+                while len(batch) < BATCH_SIZE:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    if item is _FLUSH or item is _STOP:
+                        break
+                    batch.append(item)
 
-        # Load existing entries
-        if log_file.exists():
             try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    entries = json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"Corrupted log file {log_file}: {e}")
-                # Backup corrupted file
-                backup_path = log_file.with_suffix('.json.bak')
-                log_file.rename(backup_path)
-                entries = []
+                if batch and not self._write_batch(batch):
+                    self._write_failed = True
             except Exception as e:
-                logger.error(f"Error reading log file: {e}")
-                entries = []
+                logger.error(f"Error saving log entries: {e}")
+                self._write_failed = True
+            finally:
+                # One task_done per get(), including a flush/stop marker
+                for _ in range(len(batch) + (item is _FLUSH or item is _STOP)):
+                    self._queue.task_done()
+            if item is _STOP:
+                return
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> bool:
+        """Write entries, opening each daily log file once; False if any write failed"""
+        by_date: Dict[str, List[Dict[str, Any]]] = {}
+        for data in batch:
+            by_date.setdefault(data['date'], []).append(data)
+        ok = True
+        for date_str, new_entries in by_date.items():
+            ok = self._write_entries(date_str, new_entries) and ok
+        return ok
+
+    def _log_path(self, date_str: str) -> Path:
+        """Daily log file: JSON Lines, one entry per line"""
+        if date_str != self._today or self._today_path is None:
+            self._today = date_str
+            self._today_path = self.log_dir / f"timelog_{date_str}.jsonl"
+        return self._today_path
+
+    def _migrate_legacy_log(self, date_str: str) -> None:
+        """Convert an older JSON-array daily log into the JSON Lines file"""
+        if date_str in self._migrated:
+            return
+        self._migrated.add(date_str)
+
+        legacy_file = self.log_dir / f"timelog_{date_str}.json"
+        if not legacy_file.exists():
+            return
 
-        # Add new entry
-        entries.append(entry.to_dict())
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except json.JSONDecodeError as e:
+            logger.error(f"Corrupted log file {legacy_file}: {e}")
+            # Backup corrupted file
+            os.rename(legacy_file, f"{legacy_file}.bak")
+            return
+        except Exception as e:
+            logger.error(f"Error reading log file: {e}")
+            return
 
-        # Save
+        # Older entries go first, followed by anything already in the new file
+        log_file = self._log_path(date_str)
+        temp_file = log_file.with_suffix('.jsonl.tmp')
         try:
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(entries, f, indent=2)
-            logger.debug(f"Saved log entry to {log_file}")
-            return True
-        except PermissionError as e:
-            logger.error(f"Permission denied writing log: {e}")
+            with open(temp_file, 'wb') as f:
+                for entry in entries:
+                    f.write(_to_json_line(entry))
+                if log_file.exists():
+                    with open(log_file, 'rb') as current:
+                        f.write(current.read())
+            os.replace(temp_file, log_file)
+            legacy_file.unlink()
+            logger.info(f"Migrated {legacy_file} to {log_file}")
         except Exception as e:
-            logger.error(f"Error saving log entry: {e}")
+            logger.error(f"Error migrating log file {legacy_file}: {e}")
+
+    def _write_entries(self, date_str: str, new_entries: List[Dict[str, Any]]) -> bool:
+        """Append entries to a daily log file"""
+        lines = b''.join(_to_json_line(entry) for entry in new_entries)
+
+        with self._io_lock:
+            self._migrate_legacy_log(date_str)
+            self._entry_cache.pop(date_str, None)
+            log_file = self._log_path(date_str)
+            try:
+                with open(log_file, 'ab') as f:
+                    f.write(lines)
+                logger.debug(f"Saved {len(new_entries)} log entries to {log_file}")
+                return True
+            except PermissionError as e:
+                logger.error(f"Permission denied writing log: {e}")
+            except Exception as e:
+                logger.error(f"Error saving log entry: {e}")
         return False
 
     def increment_files_renamed(self, count: int = 1) -> None:
@@ -189,38 +411,80 @@ class TimerManager:
         if not self.is_clocked_in or not self.clock_in_time:
             return "00:00:00"
         
-        elapsed = datetime.now() - self.clock_in_time
-        hours, remainder = divmod(int(elapsed.total_seconds()), 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return _format_hms(int(self.get_elapsed_seconds()))
 
     def get_elapsed_seconds(self) -> float:
         """Get elapsed time in seconds"""
         if not self.is_clocked_in or not self.clock_in_time:
             return 0.0
-        return (datetime.now() - self.clock_in_time).total_seconds()
+        # Monotonic time is cheaper than datetime.now() and ignores clock changes
+        return time.monotonic() - self._mono_in
 
     def get_today_entries(self) -> List[TimeLogEntry]:
         """Get all log entries for today"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        return self.get_entries_for_date(today)
+        return self.get_entries_for_date(date.today().isoformat())
+
+    def _open_log(self, date_str: str) -> Optional[tuple[Path, tuple[int, int]]]:
+        """
+        Prepare a daily log for reading.
+
+        Returns:
+            Tuple of (log_file, cache_key) or None if there is no log
+        """
+        self._flush()
+        with self._io_lock:
+            self._migrate_legacy_log(date_str)
+            log_file = self._log_path(date_str)
+
+            try:
+                st = os.stat(log_file)
+            except FileNotFoundError:
+                return None
+            except OSError as e:
+                logger.error(f"Error reading log entries: {e}")
+                return None
+        return log_file, (st.st_mtime_ns, st.st_size)
 
     def get_entries_for_date(self, date_str: str) -> List[TimeLogEntry]:
         """Get all log entries for a specific date"""
-        log_file = self.log_dir / f"timelog_{date_str}.json"
-        
-        if not log_file.exists():
+        opened = self._open_log(date_str)
+        if opened is None:
             return []
+        log_file, key = opened
+
+        # Reuse the parsed entries while the file is unchanged
+        cached = self._entry_cache.get(date_str)
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
 
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [TimeLogEntry.from_dict(entry) for entry in data]
+            entries = [TimeLogEntry.from_dict(data) for data in _read_log_lines(log_file)]
+            self._entry_cache[date_str] = (key, entries)
+            return list(entries)
         except Exception as e:
             logger.error(f"Error reading log entries: {e}")
             return []
 
+    def sum_durations_for_date(self, date_str: str) -> float:
+        """Get total minutes logged on a date without building entry objects"""
+        opened = self._open_log(date_str)
+        if opened is None:
+            return 0.0
+        log_file, key = opened
+
+        cached = self._entry_cache.get(date_str)
+        if cached is not None and cached[0] == key:
+            return float(sum(entry.duration_minutes for entry in cached[1]))
+
+        total = 0.0
+        try:
+            for data in _read_log_lines(log_file):
+                total += data.get('duration_minutes', 0)
+        except Exception as e:
+            logger.error(f"Error reading log entries: {e}")
+            return 0.0
+        return total
+
     def get_total_time_today(self) -> float:
         """Get total time worked today in minutes"""
-        entries = self.get_today_entries()
-        return sum(entry.duration_minutes for entry in entries)
+        return self.sum_durations_for_date(date.today().isoformat())
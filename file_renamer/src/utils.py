@@ -8,14 +8,19 @@ import re
 import sys
 import logging
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Union
 
 logger = logging.getLogger(__name__)
 
 # Characters not allowed in filenames on various systems
 INVALID_FILENAME_CHARS = r'[<>:"/\\|?*\x00-\x1f]'
 INVALID_FILENAME_PATTERN = re.compile(INVALID_FILENAME_CHARS)
+_INVALID_CHAR_SET = frozenset('<>:"/\\|?*' + ''.join(map(chr, range(32))))
+
+# One path in drop data: curly-brace wrapped (paths with spaces) or a bare token
+_DROP_PATTERN = re.compile(r'\{([^}]*)\}|(\S+)')
 
 # Reserved Windows filenames
 WINDOWS_RESERVED = {
@@ -23,11 +28,32 @@ WINDOWS_RESERVED = {
     'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
     'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9',
 }
+_RESERVED_MAXLEN = max(map(len, WINDOWS_RESERVED))
+
+
+def _reserved_name(filename: str) -> Optional[str]:
+    """Return the upper-cased name (without extension) if it is reserved on Windows"""
+    dot = filename.rfind('.')
+    base = filename if dot < 0 else filename[:dot]
+    # All reserved names are short, so longer names skip the upper() call
+    if len(base) <= _RESERVED_MAXLEN:
+        base = base.upper()
+        if base in WINDOWS_RESERVED:
+            return base
+    return None
 
 
+@lru_cache(maxsize=8)
+def _replacement_table(replacement: str) -> dict:
+    """str.translate table mapping every invalid character to replacement"""
+    return str.maketrans({c: replacement for c in _INVALID_CHAR_SET})
+
+
+@lru_cache(maxsize=1024)
 def sanitize_filename(filename: str, replacement: str = "_") -> str:
     """
     Sanitize a filename by removing/replacing invalid characters.
+    Results are cached since the same field values repeat across a batch.
     
     Args:
         filename: The filename to sanitize
@@ -39,15 +65,17 @@ def sanitize_filename(filename: str, replacement: str = "_") -> str:
     if not filename:
         return ""
 
-    # Remove/replace invalid characters
-    sanitized = INVALID_FILENAME_PATTERN.sub(replacement, filename)
+    # Remove/replace invalid characters (most names have none)
+    if _INVALID_CHAR_SET.isdisjoint(filename):
+        sanitized = filename
+    else:
+        sanitized = filename.translate(_replacement_table(replacement))
 
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip(' .')
 
     # Check for Windows reserved names
-    name_without_ext = sanitized.rsplit('.', 1)[0].upper()
-    if name_without_ext in WINDOWS_RESERVED:
+    if _reserved_name(sanitized):
         sanitized = f"_{sanitized}"
 
     # Ensure not empty
@@ -78,12 +106,12 @@ def validate_filename(filename: str) -> tuple[bool, str]:
     if not filename:
         return False, "Filename is empty"
 
-    if INVALID_FILENAME_PATTERN.search(filename):
+    if not _INVALID_CHAR_SET.isdisjoint(filename):
         return False, "Filename contains invalid characters"
 
-    name_without_ext = filename.rsplit('.', 1)[0].upper()
-    if name_without_ext in WINDOWS_RESERVED:
-        return False, f"'{name_without_ext}' is a reserved name on Windows"
+    reserved = _reserved_name(filename)
+    if reserved:
+        return False, f"'{reserved}' is a reserved name on Windows"
 
     if len(filename) > 255:
         return False, "Filename is too long"
@@ -91,6 +119,18 @@ def validate_filename(filename: str) -> tuple[bool, str]:
     return True, ""
 
 
+# Command that opens a path with the system's default handler, picked once at import
+if sys.platform == 'win32':
+    def _open_with_system(path: str) -> None:
+        os.startfile(path)
+elif sys.platform == 'darwin':  # macOS
+    def _open_with_system(path: str) -> None:
+        subprocess.run(['open', path], check=True)
+else:  # Linux and others
+    def _open_with_system(path: str) -> None:
+        subprocess.run(['xdg-open', path], check=True)
+
+
 def open_folder(folder_path: str) -> bool:
     """
     Open a folder in the system file browser (cross-platform).
@@ -101,19 +141,12 @@ def open_folder(folder_path: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    path = Path(folder_path)
-    
-    if not path.exists():
+    if not os.path.exists(folder_path):
         logger.error(f"Folder does not exist: {folder_path}")
         return False
 
     try:
-        if sys.platform == 'win32':
-            os.startfile(str(path))
-        elif sys.platform == 'darwin':  # macOS
-            subprocess.run(['open', str(path)], check=True)
-        else:  # Linux and others
-            subprocess.run(['xdg-open', str(path)], check=True)
+        _open_with_system(str(folder_path))
         logger.info(f"Opened folder: {folder_path}")
         return True
     except FileNotFoundError:
@@ -135,25 +168,42 @@ def open_file(file_path: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    path = Path(file_path)
-    
-    if not path.exists():
+    if not os.path.exists(file_path):
         logger.error(f"File does not exist: {file_path}")
         return False
 
     try:
-        if sys.platform == 'win32':
-            os.startfile(str(path))
-        elif sys.platform == 'darwin':
-            subprocess.run(['open', str(path)], check=True)
-        else:
-            subprocess.run(['xdg-open', str(path)], check=True)
+        _open_with_system(str(file_path))
         return True
     except Exception as e:
         logger.error(f"Error opening file: {e}")
     return False
 
 
+# Fonts for the current platform, picked once at import
+if sys.platform == 'darwin':
+    _PLATFORM_FONTS = {
+        'display': ('SF Pro Display', 10, 'bold'),
+        'body': ('SF Pro Text', 9, 'normal'),
+        'small': ('SF Pro Text', 8, 'normal'),
+        'mono': ('SF Mono', 9, 'normal'),
+    }
+elif sys.platform == 'win32':
+    _PLATFORM_FONTS = {
+        'display': ('Segoe UI', 10, 'bold'),
+        'body': ('Segoe UI', 9, 'normal'),
+        'small': ('Segoe UI', 8, 'normal'),
+        'mono': ('Cascadia Code', 9, 'normal'),
+    }
+else:
+    _PLATFORM_FONTS = {
+        'display': ('Ubuntu', 10, 'bold'),
+        'body': ('Ubuntu', 9, 'normal'),
+        'small': ('Ubuntu', 8, 'normal'),
+        'mono': ('Ubuntu Mono', 9, 'normal'),
+    }
+
+
 def get_platform_font(font_type: str = 'body') -> tuple:
     """
     Get appropriate font for the current platform.
@@ -164,43 +214,21 @@ def get_platform_font(font_type: str = 'body') -> tuple:
     Returns:
         Font tuple (family, size, weight)
     """
-    if sys.platform == 'darwin':
-        fonts = {
-            'display': ('SF Pro Display', 10, 'bold'),
-            'body': ('SF Pro Text', 9, 'normal'),
-            'small': ('SF Pro Text', 8, 'normal'),
-            'mono': ('SF Mono', 9, 'normal'),
-        }
-    elif sys.platform == 'win32':
-        fonts = {
-            'display': ('Segoe UI', 10, 'bold'),
-            'body': ('Segoe UI', 9, 'normal'),
-            'small': ('Segoe UI', 8, 'normal'),
-            'mono': ('Cascadia Code', 9, 'normal'),
-        }
-    else:
-        fonts = {
-            'display': ('Ubuntu', 10, 'bold'),
-            'body': ('Ubuntu', 9, 'normal'),
-            'small': ('Ubuntu', 8, 'normal'),
-            'mono': ('Ubuntu Mono', 9, 'normal'),
-        }
+    return _PLATFORM_FONTS.get(font_type, _PLATFORM_FONTS['body'])
 
-    return fonts.get(font_type, fonts['body'])
 
-
-def ensure_directory(path: Path) -> bool:
+def ensure_directory(path: Union[str, Path]) -> bool:
     """
     Ensure a directory exists, creating it if necessary.
     
     Args:
-        path: Path to directory
+        path: Path to directory (str or Path)
         
     Returns:
         True if directory exists or was created
     """
     try:
-        path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(path, exist_ok=True)
         return True
     except PermissionError:
         logger.error(f"Permission denied creating directory: {path}")
@@ -209,14 +237,16 @@ def ensure_directory(path: Path) -> bool:
     return False
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def get_file_size_str(size_bytes: int) -> str:
     """Convert bytes to human readable string"""
-    size = float(size_bytes)
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} TB"
+    if size_bytes < 1024:
+        return f"{float(size_bytes):.1f} B"
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    idx = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def get_unique_path(base_path: Path, format_str: str = "_{n}") -> Path:
@@ -237,12 +267,22 @@ def get_unique_path(base_path: Path, format_str: str = "_{n}") -> Path:
     suffix = base_path.suffix
     parent = base_path.parent
 
+    # List the folder once and test candidates against the (casefolded)
+    # names in memory instead of stat-ing each one
+    try:
+        with os.scandir(parent) as entries:
+            existing = {entry.name.casefold() for entry in entries}
+    except OSError:
+        existing = None
+
     n = 1
     while True:
         new_name = stem + format_str.format(n=n) + suffix
-        new_path = parent / new_name
-        if not new_path.exists():
-            return new_path
+        if existing is None:
+            if not (parent / new_name).exists():
+                return parent / new_name
+        elif new_name.casefold() not in existing:
+            return parent / new_name
         n += 1
         if n > 9999:
             raise ValueError("Could not find unique path after 9999 attempts")
@@ -259,18 +299,14 @@ def parse_dropped_files(data: str) -> List[str]:
     Returns:
         List of file paths
     """
-    files = []
-    
-    # Handle curly brace format (Windows with spaces)
-    if '{' in data:
-        # Extract paths in curly braces
-        files.extend(re.findall(r'\{([^}]+)\}', data))
-        # Remove the braced parts and get remaining
-        remaining = re.sub(r'\{[^}]+\}', '', data)
-        files.extend(remaining.split())
-    else:
-        # Simple space/newline separated
-        files = data.replace('\n', ' ').split()
-
-    # Clean up and filter
-    return [f.strip() for f in files if f.strip() and os.path.exists(f.strip())]
+    # Single pass over the data; paths come back in the order they were dropped
+    seen = set()
+    result = []
+    for braced, bare in _DROP_PATTERN.findall(data):
+        # Clean up, drop duplicates and stat each distinct path once
+        path = (braced or bare).strip()
+        if path and path not in seen:
+            seen.add(path)
+            if os.path.exists(path):
+                result.append(path)
+    return result
@@ -4,20 +4,46 @@ Styled UI components with the Creative Studio theme
 """
 
 import os
+import math
 import tkinter as tk
-from tkinter import ttk, filedialog
+from functools import lru_cache
+from tkinter import ttk
 from typing import Callable, Optional, List
 
 from .theme import Theme
 from .utils import parse_dropped_files
 
-# Try to import drag-drop support
-try:
-    from tkinterdnd2 import DND_FILES
-    HAS_DND = True
-except ImportError:
-    HAS_DND = False
-    DND_FILES = None
+@lru_cache(maxsize=None)
+def _dnd_files() -> Optional[str]:
+    """
+    The tkinterdnd2 DND_FILES type, or None if drag-drop is unavailable.
+    Imported on first DropZone rather than with this module.
+    """
+    try:
+        from tkinterdnd2 import DND_FILES
+    except ImportError:
+        return None
+    return DND_FILES
+
+
+# One tooltip window shared by every widget, hidden while not in use
+_TOOLTIP = None
+
+
+def _get_tooltip(widget):
+    """Return the shared (window, label) tooltip pair, building it on first use"""
+    global _TOOLTIP
+    if _TOOLTIP is None or not _TOOLTIP[0].winfo_exists():
+        tw = tk.Toplevel(widget._root())
+        tw.wm_overrideredirect(True)
+        tw.wm_withdraw()
+        label = tk.Label(tw, justify='left',
+                        background=Theme.BG_ELEVATED, foreground=Theme.TEXT_PRIMARY,
+                        relief='solid', borderwidth=1, font=Theme.FONT_SMALL,
+                        padx=6, pady=3)
+        label.pack()
+        _TOOLTIP = (tw, label)
+    return _TOOLTIP
 
 
 class StyledButton(tk.Canvas):
@@ -34,6 +60,7 @@ class StyledButton(tk.Canvas):
         self._enabled = True
         self._tooltip_text = ""
         self._tooltip_window = None
+        self._tooltip_after_id = None
 
         self.colors = {
             "primary": {
@@ -65,48 +92,71 @@ class StyledButton(tk.Canvas):
                 "fg_disabled": Theme.TEXT_TERTIARY
             }
         }
+        # Resolved once so hover handlers only read instance attributes
+        c = self.colors.get(self.variant, self.colors["primary"])
+        self._bg_c, self._bg_hover_c, self._fg_c = c["bg"], c["bg_hover"], c["fg"]
+        self._bg_disabled_c, self._fg_disabled_c = c["bg_disabled"], c["fg_disabled"]
 
         try:
             self.configure(bg=parent.cget('bg'))
         except:
             self.configure(bg=Theme.BG_PRIMARY)
             
-        self._draw()
+        self._draw_initial()
+        self.config(cursor="hand2")
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
         self.bind("<Button-1>", self._on_click)
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _rounded_points(w: int, h: int, r: int, seg: int = 6) -> tuple:
+        """
+        Outline of a rounded rectangle inset 2px, with each corner arc already
+        split into seg straight pieces, so Tk doesn't need to smooth it.
+        Shared by all buttons of the same size.
+        """
+        corners = (  # arc centre and start angle, clockwise from top-left
+            (2 + r, 2 + r, math.pi),
+            (w - 2 - r, 2 + r, 1.5 * math.pi),
+            (w - 2 - r, h - 2 - r, 0.0),
+            (2 + r, h - 2 - r, 0.5 * math.pi),
+        )
+        points = []
+        for cx, cy, start in corners:
+            for i in range(seg + 1):
+                a = start + (math.pi / 2) * i / seg
+                points.append(round(cx + r * math.cos(a), 2))
+                points.append(round(cy + r * math.sin(a), 2))
+        return tuple(points)
+
+    def _draw_initial(self):
+        """Create the button shape and label once; _draw only recolors them"""
+        # Draw rounded rectangle
+        # Radius 3 matches the corners Tk drew from the old 6px smoothed control points
+        points = StyledButton._rounded_points(self._width, self._height, 3)
+        self._bg_id = self.create_polygon(points, smooth=False, outline="")
+        self._text_id = self.create_text(self._width // 2, self._height // 2, text=self.text, 
+                                         font=Theme.FONT_BUTTON)
+        self._draw()
+
     def _draw(self, hover: bool = False):
-        self.delete("all")
-        colors = self.colors.get(self.variant, self.colors["primary"])
-        
         if not self._enabled:
-            bg, fg = colors["bg_disabled"], colors["fg_disabled"]
+            bg, fg = self._bg_disabled_c, self._fg_disabled_c
         else:
-            bg = colors["bg_hover"] if hover else colors["bg"]
-            fg = colors["fg"]
+            bg = self._bg_hover_c if hover else self._bg_c
+            fg = self._fg_c
         
-        # Draw rounded rectangle
-        r = 6
-        points = [
-            2+r, 2, self._width-2-r, 2, self._width-2, 2, self._width-2, 2+r,
-            self._width-2, self._height-2-r, self._width-2, self._height-2,
-            self._width-2-r, self._height-2, 2+r, self._height-2,
-            2, self._height-2, 2, self._height-2-r, 2, 2+r, 2, 2
-        ]
-        self.create_polygon(points, smooth=True, fill=bg, outline="")
-        self.create_text(self._width // 2, self._height // 2, text=self.text, 
-                        fill=fg, font=Theme.FONT_BUTTON)
+        self.itemconfig(self._bg_id, fill=bg)
+        self.itemconfig(self._text_id, fill=fg)
 
     def _on_enter(self, e):
         if self._enabled:
             self._draw(hover=True)
-            self.config(cursor="hand2")
         self._show_tooltip()
 
     def _on_leave(self, e):
         self._draw(hover=False)
-        self.config(cursor="")
         self._hide_tooltip()
 
     def _on_click(self, e):
@@ -115,31 +165,37 @@ class StyledButton(tk.Canvas):
 
     def set_enabled(self, enabled: bool):
         self._enabled = enabled
+        # The cursor only depends on the enabled state, not on hover
+        self.config(cursor="hand2" if enabled else "")
         self._draw()
 
     def set_tooltip(self, text: str):
         self._tooltip_text = text
 
     def _show_tooltip(self):
-        if not self._tooltip_text:
+        # Wait for a real hover so sweeping across a row of buttons shows nothing
+        if not self._tooltip_text or self._tooltip_after_id or self._tooltip_window:
             return
-        x, y, _, _ = self.bbox("all") if self.bbox("all") else (0, 0, 0, 0)
-        x += self.winfo_rootx() + 25
-        y += self.winfo_rooty() + 25
+        self._tooltip_after_id = self.after(Theme.TOOLTIP_DELAY, self._do_show_tooltip)
+
+    def _do_show_tooltip(self):
+        self._tooltip_after_id = None
+        # The button shape never moves, so anchor on its known top-left corner
+        # rather than asking the canvas for bbox("all")
+        x = self.winfo_rootx() + 2 + 25
+        y = self.winfo_rooty() + 2 + 25
         
-        self._tooltip_window = tw = tk.Toplevel(self)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        
-        label = tk.Label(tw, text=self._tooltip_text, justify='left',
-                        background=Theme.BG_ELEVATED, foreground=Theme.TEXT_PRIMARY,
-                        relief='solid', borderwidth=1, font=Theme.FONT_SMALL,
-                        padx=6, pady=3)
-        label.pack()
+        self._tooltip_window, label = _get_tooltip(self)
+        label.config(text=self._tooltip_text)
+        self._tooltip_window.wm_geometry(f"+{x}+{y}")
+        self._tooltip_window.deiconify()
 
     def _hide_tooltip(self):
+        if self._tooltip_after_id:
+            self.after_cancel(self._tooltip_after_id)
+            self._tooltip_after_id = None
         if self._tooltip_window:
-            self._tooltip_window.destroy()
+            self._tooltip_window.withdraw()
             self._tooltip_window = None
 
 
@@ -151,10 +207,9 @@ class SectionCard(tk.Frame):
         self.configure(highlightbackground=Theme.BORDER_SUBTLE, highlightthickness=1)
 
         if title:
-            title_frame = tk.Frame(self, bg=Theme.BG_SECONDARY)
-            title_frame.pack(fill="x", padx=Theme.PAD_MD, pady=(Theme.PAD_MD, Theme.PAD_SM))
-            tk.Label(title_frame, text=title.upper(), font=Theme.FONT_SECTION,
-                    fg=Theme.TEXT_SECONDARY, bg=Theme.BG_SECONDARY).pack(side="left")
+            tk.Label(self, text=title.upper(), font=Theme.FONT_SECTION,
+                    fg=Theme.TEXT_SECONDARY, bg=Theme.BG_SECONDARY).pack(
+                        anchor="w", padx=Theme.PAD_MD, pady=(Theme.PAD_MD, Theme.PAD_SM))
             tk.Frame(self, bg=Theme.ACCENT_PRIMARY, height=2).pack(fill="x", padx=Theme.PAD_MD)
 
         self.content = tk.Frame(self, bg=Theme.BG_SECONDARY)
@@ -171,6 +226,9 @@ class DropZone(tk.Frame):
 
         self.base_color = color
         self.files: List[str] = []
+        self._files_set = set()  # mirrors self.files for O(1) duplicate checks
+        self._display_names: List[str] = []  # basenames, parallel to self.files
+        self._displayed_count = 0  # files already inserted into the listbox
         self.on_files_changed: Optional[Callable[[], None]] = None
 
         # Content
@@ -213,9 +271,10 @@ class DropZone(tk.Frame):
                                   borderwidth=0, font=Theme.FONT_MONO, height=3)
 
         # Setup DnD if available
-        if HAS_DND:
+        dnd_files = _dnd_files()
+        if dnd_files:
             try:
-                self.drop_target_register(DND_FILES)
+                self.drop_target_register(dnd_files)
                 self.dnd_bind('<<Drop>>', self._handle_drop)
                 self.dnd_bind('<<DragEnter>>', lambda e: self.config(highlightbackground=Theme.ACCENT_PRIMARY))
                 self.dnd_bind('<<DragLeave>>', lambda e: self.config(highlightbackground=Theme.BORDER_DEFAULT))
@@ -225,35 +284,54 @@ class DropZone(tk.Frame):
     def _handle_drop(self, event):
         self.config(highlightbackground=Theme.BORDER_DEFAULT)
         files = parse_dropped_files(event.data)
+        added = False
         for f in files:
-            if os.path.isfile(f) and f not in self.files:
-                self.files.append(f)
+            if os.path.isfile(f) and self._add_file(f):
+                added = True
+        if not added:
+            return  # nothing new (empty drop or only duplicates)
         self._update_display()
         if self.on_files_changed:
             self.on_files_changed()
 
+    def _add_file(self, path: str) -> bool:
+        """Append path unless already present; returns True if it was added"""
+        if path in self._files_set:
+            return False
+        self.files.append(path)
+        self._files_set.add(path)
+        self._display_names.append(os.path.basename(path))
+        return True
+
     def _update_display(self):
         if self.files:
             self.placeholder.pack_forget()
             self.listbox.pack(fill="both", expand=True)
-            self.listbox.delete(0, tk.END)
-            for f in self.files:
-                self.listbox.insert(tk.END, os.path.basename(f))
+            # Files are only ever appended, so just insert the new tail
+            names = self._display_names[self._displayed_count:]
+            if names:
+                # One Tcl call for the whole batch
+                self.listbox.insert(tk.END, *names)
+            self._displayed_count = len(self.files)
         else:
             self.listbox.pack_forget()
             self.placeholder.pack(expand=True)
 
     def clear_files(self):
         self.files.clear()
+        self._files_set.clear()
+        self._display_names.clear()
+        self.listbox.delete(0, tk.END)
+        self._displayed_count = 0
         self._update_display()
         if self.on_files_changed:
             self.on_files_changed()
 
     def add_files_dialog(self):
+        from tkinter import filedialog
         files = filedialog.askopenfilenames(title="Select Files", filetypes=[("All Files", "*.*")])
         for f in files:
-            if f not in self.files:
-                self.files.append(f)
+            self._add_file(f)
         self._update_display()
         if self.on_files_changed:
             self.on_files_changed()
@@ -266,7 +344,10 @@ class DropZone(tk.Frame):
 
     def remove_file(self, index: int):
         if 0 <= index < len(self.files):
-            self.files.pop(index)
+            self._files_set.discard(self.files.pop(index))
+            self._display_names.pop(index)
+            self.listbox.delete(index)
+            self._displayed_count -= 1
             self._update_display()
             if self.on_files_changed:
                 self.on_files_changed()
@@ -276,10 +357,16 @@ class StyledEntry(tk.Entry):
     """Custom styled entry with placeholder support"""
 
     def __init__(self, parent, placeholder: str = "", **kwargs):
+        # Mirror the text into a Python string on every change so reads
+        # don't need a Tcl round-trip
+        self._var = kwargs.pop("textvariable", None) or tk.StringVar(parent)
+        self._value = self._var.get()
         super().__init__(parent, bg=Theme.BG_TERTIARY, fg=Theme.TEXT_PRIMARY,
                         insertbackground=Theme.ACCENT_PRIMARY, relief="flat",
                         highlightthickness=2, highlightbackground=Theme.BORDER_SUBTLE,
-                        highlightcolor=Theme.BORDER_FOCUS, font=Theme.FONT_BODY, **kwargs)
+                        highlightcolor=Theme.BORDER_FOCUS, font=Theme.FONT_BODY,
+                        textvariable=self._var, **kwargs)
+        self._var.trace_add("write", self._on_var_write)
         self.placeholder = placeholder
         self._has_placeholder = False
         
@@ -288,8 +375,11 @@ class StyledEntry(tk.Entry):
             self.bind("<FocusIn>", self._on_focus_in)
             self.bind("<FocusOut>", self._on_focus_out)
 
+    def _on_var_write(self, *args):
+        self._value = self._var.get()
+
     def _show_placeholder(self):
-        if not self.get():
+        if not self._value:
             self._has_placeholder = True
             self.insert(0, self.placeholder)
             self.config(fg=Theme.TEXT_TERTIARY)
@@ -301,19 +391,26 @@ class StyledEntry(tk.Entry):
             self._has_placeholder = False
 
     def _on_focus_out(self, e):
-        if not self.get():
+        if not self._value:
             self._show_placeholder()
 
     def get_value(self) -> str:
         """Get the actual value (not placeholder)"""
         if self._has_placeholder:
             return ""
-        return self.get().strip()
+        return self._value.strip()
 
 
 class StatusBar(tk.Frame):
     """Status bar for displaying messages"""
 
+    _MSG_COLORS = {
+        "info": Theme.TEXT_SECONDARY,
+        "success": Theme.ACCENT_SUCCESS,
+        "warning": Theme.ACCENT_WARNING,
+        "error": Theme.ACCENT_DANGER,
+    }
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, bg=Theme.BG_TERTIARY, **kwargs)
         
@@ -327,20 +424,26 @@ class StatusBar(tk.Frame):
                                    anchor="e")
         self.info_label.pack(side="right", padx=Theme.PAD_SM, pady=2)
 
+        self._pending_message = None
+        self._message_after_id = None
+
     def set_message(self, message: str, message_type: str = "info"):
-        colors = {
-            "info": Theme.TEXT_SECONDARY,
-            "success": Theme.ACCENT_SUCCESS,
-            "warning": Theme.ACCENT_WARNING,
-            "error": Theme.ACCENT_DANGER,
-        }
-        self.message_label.config(text=message, fg=colors.get(message_type, Theme.TEXT_SECONDARY))
+        # Rapid updates (e.g. per file during a batch) collapse into one
+        # label update when Tk is next idle; the last message wins
+        self._pending_message = (message, self._MSG_COLORS.get(message_type, Theme.TEXT_SECONDARY))
+        if self._message_after_id is None:
+            self._message_after_id = self.after_idle(self._flush_message)
+
+    def _flush_message(self):
+        self._message_after_id = None
+        message, fg = self._pending_message
+        self.message_label.config(text=message, fg=fg)
 
     def set_info(self, info: str):
         self.info_label.config(text=info)
 
     def clear(self):
-        self.message_label.config(text="Ready", fg=Theme.TEXT_SECONDARY)
+        self.set_message("Ready")
         self.info_label.config(text="")
 
 
@@ -351,31 +454,50 @@ class Tooltip:
         self.widget = widget
         self.text = text
         self.tooltip_window = None
+        self._after_id = None
         
-        widget.bind("<Enter>", self._show)
+        widget.bind("<Enter>", self._schedule)
         widget.bind("<Leave>", self._hide)
 
+    def _schedule(self, event=None):
+        if self._after_id or self.tooltip_window:
+            return
+        self._after_id = self.widget.after(Theme.TOOLTIP_DELAY, self._show)
+
     def _show(self, event=None):
-        x, y, _, _ = self.widget.bbox("insert") if hasattr(self.widget, 'bbox') else (0, 0, 0, 0)
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 25
-        
-        self.tooltip_window = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
+        self._after_id = None
+        # Fixed offset from the widget's corner; no per-hover bbox query
+        x = self.widget.winfo_rootx() + 25
+        y = self.widget.winfo_rooty() + 25
         
-        label = tk.Label(tw, text=self.text, justify='left',
-                        background=Theme.BG_ELEVATED, foreground=Theme.TEXT_PRIMARY,
-                        relief='solid', borderwidth=1, font=Theme.FONT_SMALL,
-                        padx=6, pady=3)
-        label.pack()
+        self.tooltip_window, label = _get_tooltip(self.widget)
+        label.config(text=self.text)
+        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        self.tooltip_window.deiconify()
 
     def _hide(self, event=None):
+        if self._after_id:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
         if self.tooltip_window:
-            self.tooltip_window.destroy()
+            self.tooltip_window.withdraw()
             self.tooltip_window = None
 
 
+def _route_mousewheel(event):
+    """Send a wheel event to the innermost ScrollableFrame under the pointer"""
+    try:
+        widget = event.widget.winfo_containing(event.x_root, event.y_root)
+    except (AttributeError, KeyError, tk.TclError):
+        return  # pointer is over a window tkinter doesn't know about
+    while widget is not None:
+        owner = getattr(widget, "_scroll_owner", None)
+        if owner is not None:
+            owner._on_mousewheel(event)
+            return
+        widget = widget.master
+
+
 class ScrollableFrame(tk.Frame):
     """A scrollable frame container"""
 
@@ -398,9 +520,20 @@ class ScrollableFrame(tk.Frame):
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
-        # Bind mousewheel
-        self.canvas.bind("<Enter>", self._bind_mousewheel)
-        self.canvas.bind("<Leave>", self._unbind_mousewheel)
+        # Wheel events go to the widget under the pointer (or the focus widget
+        # on Windows), usually a child of the canvas, so a canvas-only binding
+        # would miss them. One shared handler per root routes each event to
+        # the frame under the pointer; it holds no reference to any frame, so
+        # destroyed frames are simply never found.
+        self.canvas._scroll_owner = self
+        root = self._root()
+        if not getattr(root, "_wheel_routed", False):
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                root.bind_all(sequence, _route_mousewheel, add="+")
+            root._wheel_routed = True
+        self._pending_scroll = 0
+        self._scroll_after_id = None
+        self.canvas.bind("<Destroy>", self._on_canvas_destroy)
 
         # Make frame expand with canvas
         self.canvas.bind("<Configure>", self._on_canvas_configure)
@@ -408,19 +541,25 @@ class ScrollableFrame(tk.Frame):
     def _on_canvas_configure(self, event):
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
-    def _bind_mousewheel(self, event):
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
-
-    def _unbind_mousewheel(self, event):
-        self.canvas.unbind_all("<MouseWheel>")
-        self.canvas.unbind_all("<Button-4>")
-        self.canvas.unbind_all("<Button-5>")
+    def _on_canvas_destroy(self, event):
+        if event.widget is self.canvas and self._scroll_after_id is not None:
+            self.after_cancel(self._scroll_after_id)
+            self._scroll_after_id = None
 
     def _on_mousewheel(self, event):
         # Windows/macOS
         if event.num == 4 or event.delta > 0:
-            self.canvas.yview_scroll(-1, "units")
+            self._pending_scroll -= 1
         elif event.num == 5 or event.delta < 0:
-            self.canvas.yview_scroll(1, "units")
+            self._pending_scroll += 1
+        else:
+            return
+        # Touchpads send bursts of events; scroll once per idle tick
+        if self._scroll_after_id is None:
+            self._scroll_after_id = self.after_idle(self._flush_scroll)
+
+    def _flush_scroll(self):
+        self._scroll_after_id = None
+        units, self._pending_scroll = self._pending_scroll, 0
+        if units:
+            self.canvas.yview_scroll(units, "units")
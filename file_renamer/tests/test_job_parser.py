@@ -79,6 +79,14 @@ class TestJobFolderParser:
         
         assert result.po_number == "PO-98765"
 
+    def test_parse_po_with_earlier_parentheses(self):
+        """Test PO extraction when the name has other parentheses"""
+        folder = "12345_JohnDoe_(Acme)_MUG-11OZ x 100_(PO-98765)"
+        result = JobFolderParser.parse(folder)
+
+        assert result.po_number == "PO-98765"
+        assert result.quantity == "100"
+
     def test_is_valid(self):
         """Test is_valid method"""
         valid = JobFolderParser.parse("12345_Customer")
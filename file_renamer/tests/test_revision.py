@@ -0,0 +1,75 @@
+"""Tests for RevisionDetector"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from src.revision import RevisionDetector
+
+
+BASE = "12345_MUG-11OZ_(BlueDog)_SOURCE"
+
+
+def make_files(folder, names):
+    """Create empty files in folder"""
+    for name in names:
+        (Path(folder) / name).touch()
+
+
+class TestRevisionDetector:
+    """Tests for RevisionDetector class"""
+
+    def test_first_revision_for_empty_folder(self):
+        """Test first revision is suggested when nothing exists"""
+        detector = RevisionDetector(["1", "2", "3", "FINAL"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            assert detector.find_next_revision(tmpdir, BASE) == "1"
+
+    def test_next_revision_after_highest(self):
+        """Test next revision follows the highest existing one"""
+        detector = RevisionDetector(["1", "2", "3", "FINAL"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            make_files(tmpdir, [f"{BASE}_1.psd", f"{BASE}_2.psd", "other_5.psd"])
+            assert detector.find_next_revision(tmpdir, BASE, ".psd") == "3"
+
+    def test_final_suggests_final(self):
+        """Test FINAL is suggested once a FINAL file exists"""
+        detector = RevisionDetector(["1", "2", "FINAL"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            make_files(tmpdir, [f"{BASE}_1.psd", f"{BASE}_final.psd"])
+            assert detector.find_next_revision(tmpdir, BASE, ".psd") == "FINAL"
+
+    def test_existing_revisions_across_extensions(self):
+        """Test existing revisions are collected from all design extensions"""
+        detector = RevisionDetector(None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            make_files(tmpdir, [f"{BASE}_2.ai", f"{BASE}_1.psd", f"{BASE}_FINAL.pdf",
+                                f"{BASE}_3.txt"])
+            assert detector.get_existing_revisions(tmpdir, BASE) == ["1", "2", "FINAL"]
+
+    def test_invalid_folder(self):
+        """Test missing folder falls back to the first revision"""
+        detector = RevisionDetector(["A", "B"])
+        assert detector.find_next_revision("/nonexistent/folder", BASE) == "A"
+        assert detector.get_existing_revisions("/nonexistent/folder", BASE) == []
+
+    def test_is_valid_revision(self):
+        """Test revision validation"""
+        detector = RevisionDetector(["1", "2", "FINAL"])
+        assert detector.is_valid_revision("FINAL") == True
+        assert detector.is_valid_revision("7") == True
+        assert detector.is_valid_revision("DRAFT") == False
+
+    def test_parse_revision_from_filename(self):
+        """Test extracting revision from a filename"""
+        detector = RevisionDetector(None)
+        assert detector.parse_revision_from_filename(f"{BASE}_3.psd") == "3"
+        assert detector.parse_revision_from_filename(f"{BASE}_final.psd") == "FINAL"
+        assert detector.parse_revision_from_filename("no_revision.psd") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
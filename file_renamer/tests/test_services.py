@@ -0,0 +1,368 @@
+"""Tests for RenameService and UndoManager"""
+
+import sys
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from src import services
+from src.services import RenameService, UndoManager, RenameSession, RenameRecord, FileOperation
+
+
+@pytest.fixture
+def workdir():
+    """Temporary directory with a source folder and a destination folder"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = Path(tmpdir) / "src"
+        dest = Path(tmpdir) / "dest"
+        src.mkdir()
+        yield src, dest
+
+
+def make_file(folder: Path, name: str, content: str = "data") -> str:
+    """Create a file and return its path as a string"""
+    path = folder / name
+    path.write_text(content)
+    return str(path)
+
+
+class TestGenerateFilename:
+    """Tests for RenameService.generate_filename"""
+
+    def test_full_convention(self):
+        """Test all parts are joined following the naming convention"""
+        service = RenameService()
+        result = service.generate_filename("/tmp/art.PSD", "12345", "MUG-11OZ",
+                                           "BlueDog", "PROOF", "1")
+        assert result == "12345_MUG-11OZ_(BlueDog)_PROOF_1.psd"
+
+    def test_skips_empty_parts(self):
+        """Test empty parts are left out"""
+        service = RenameService()
+        result = service.generate_filename("art.png", "12345", "", "", "PRINT", "2")
+        assert result == "12345_PRINT_2.png"
+
+    def test_no_parts_keeps_original_name(self):
+        """Test original name is kept when no parts are given"""
+        service = RenameService()
+        assert service.generate_filename("/tmp/art.png", "", "", "", "", "") == "art.png"
+
+
+class TestRenameFiles:
+    """Tests for RenameService.rename_files"""
+
+    def test_moves_files(self, workdir):
+        """Test files are moved and renamed into the destination"""
+        src, dest = workdir
+        a = make_file(src, "a.psd")
+        b = make_file(src, "b.psd")
+
+        service = RenameService()
+        session = service.rename_files(
+            [{'path': a, 'new_name': "1_A_1.psd"}, {'path': b, 'new_name': "1_B_1.psd"}],
+            str(dest), "1")
+
+        assert session.success_count == 2
+        assert session.error_count == 0
+        assert (dest / "1_A_1.psd").exists()
+        assert (dest / "1_B_1.psd").exists()
+        assert not os.path.exists(a)
+
+    def test_skip_duplicates(self, workdir):
+        """Test existing destination files are skipped"""
+        src, dest = workdir
+        dest.mkdir()
+        make_file(dest, "1_A_1.psd", "old")
+        a = make_file(src, "a.psd", "new")
+
+        session = RenameService().rename_files(
+            [{'path': a, 'new_name': "1_A_1.psd"}], str(dest), "1", duplicate_mode="skip")
+
+        assert session.error_count == 1
+        assert session.records[0].error == "File already exists"
+        assert (dest / "1_A_1.psd").read_text() == "old"
+        assert os.path.exists(a)
+
+    def test_increment_duplicates(self, workdir):
+        """Test existing destination files get a numbered name"""
+        src, dest = workdir
+        dest.mkdir()
+        make_file(dest, "1_A_1.psd", "old")
+        a = make_file(src, "a.psd", "new")
+
+        session = RenameService().rename_files(
+            [{'path': a, 'new_name': "1_A_1.psd"}], str(dest), "1", duplicate_mode="increment")
+
+        assert session.success_count == 1
+        assert session.records[0].new_path == str(dest / "1_A_1_1.psd")
+        assert (dest / "1_A_1_1.psd").read_text() == "new"
+
+    def test_overwrite_duplicates(self, workdir):
+        """Test existing destination files are replaced"""
+        src, dest = workdir
+        dest.mkdir()
+        make_file(dest, "1_A_1.psd", "old")
+        a = make_file(src, "a.psd", "new")
+
+        session = RenameService().rename_files(
+            [{'path': a, 'new_name': "1_A_1.psd"}], str(dest), "1", duplicate_mode="overwrite")
+
+        assert session.success_count == 1
+        assert (dest / "1_A_1.psd").read_text() == "new"
+
+    @pytest.mark.parametrize("mode", ["overwrite", "skip"])
+    def test_new_name_is_another_files_source(self, workdir, mode):
+        """Test a file renamed onto a path another batch file is moving away from"""
+        src, dest = workdir
+        dest.mkdir()
+        a = make_file(dest, "A.psd", "original A")
+        c = make_file(src, "C.psd", "C")
+        files = [{'path': a, 'new_name': "B.psd"}, {'path': c, 'new_name': "A.psd"}]
+
+        session = RenameService().rename_files(files, str(dest), "1", duplicate_mode=mode)
+
+        assert [(r.new_name, r.success, r.error) for r in session.records] == [
+            ("B.psd", True, ""), ("A.psd", True, "")]
+        assert (dest / "B.psd").read_text() == "original A"
+        assert (dest / "A.psd").read_text() == "C"
+
+    def test_same_name_in_batch(self, workdir):
+        """Test a second file with the same new name is treated as a duplicate"""
+        src, dest = workdir
+        a = make_file(src, "a.psd", "first")
+        b = make_file(src, "b.psd", "second")
+
+        session = RenameService().rename_files(
+            [{'path': a, 'new_name': "1_A_1.psd"}, {'path': b, 'new_name': "1_A_1.psd"}],
+            str(dest), "1", duplicate_mode="skip")
+
+        assert session.success_count == 1
+        assert session.records[1].error == "File already exists"
+        assert (dest / "1_A_1.psd").read_text() == "first"
+
+    def test_progress_reports_every_file(self, workdir):
+        """Test progress callback reaches the total"""
+        src, dest = workdir
+        files = [{'path': make_file(src, f"{i}.psd"), 'new_name': f"1_{i}.psd"}
+                 for i in range(5)]
+        progress = []
+
+        RenameService().rename_files(files, str(dest), "1",
+                                     on_progress=lambda i, n, name: progress.append((i, n)))
+
+        assert progress[-1] == (5, 5)
+
+    def test_progress_is_throttled(self, workdir):
+        """Test large batches report fewer updates than files but still finish"""
+        src, dest = workdir
+        files = [{'path': str(src / f"{i}.psd"), 'new_name': f"1_{i}.psd"}
+                 for i in range(1000)]
+        progress = []
+
+        RenameService().rename_files(files, str(dest), "1",
+                                     on_progress=lambda i, n, name: progress.append((i, n)))
+
+        assert len(progress) < 1000
+        assert progress[-1] == (1000, 1000)
+
+    def test_missing_source(self, workdir):
+        """Test a missing source file is reported as an error"""
+        src, dest = workdir
+        session = RenameService().rename_files(
+            [{'path': str(src / "missing.psd"), 'new_name': "1_A_1.psd"}], str(dest), "1")
+
+        assert session.error_count == 1
+        assert session.records[0].error == "Source file not found"
+
+    def test_folder_source_is_rejected(self, workdir):
+        """Test a folder passed as a source is not moved"""
+        src, dest = workdir
+        folder = src / "folder"
+        folder.mkdir()
+
+        session = RenameService().rename_files(
+            [{'path': str(folder), 'new_name': "1_A_1.psd"}], str(dest), "1")
+
+        assert session.error_count == 1
+        assert session.records[0].error == "Not a file"
+        assert folder.is_dir()
+
+
+class TestRenameFilesAsync:
+    """Tests for RenameService.rename_files_async"""
+
+    def test_returns_future_and_calls_on_complete(self, workdir):
+        """Test the future resolves to the session passed to on_complete"""
+        src, dest = workdir
+        a = make_file(src, "a.psd")
+        completed = []
+        done = threading.Event()
+
+        def on_complete(session):
+            completed.append(session)
+            done.set()
+
+        future = RenameService().rename_files_async(
+            [{'path': a, 'new_name': "1_A_1.psd"}], str(dest), "1",
+            on_complete=on_complete)
+        session = future.result(timeout=10)
+
+        assert session.success_count == 1
+        assert (dest / "1_A_1.psd").exists()
+        assert done.wait(timeout=10)
+        assert completed == [session]
+
+
+class TestValidateFiles:
+    """Tests for RenameService.validate_files"""
+
+    def test_validation_results(self, workdir):
+        """Test files, folders and missing paths are classified"""
+        src, _ = workdir
+        a = make_file(src, "a.psd")
+        missing = str(src / "missing.psd")
+
+        results = RenameService().validate_files([a, str(src), missing])
+
+        assert results[0] == (a, True, "")
+        assert results[1] == (str(src), False, "Not a file")
+        assert results[2] == (missing, False, "File not found")
+
+    def test_revalidation_sees_new_file(self, workdir):
+        """Test a file created after a failed validation is then reported valid"""
+        src, _ = workdir
+        path = str(src / "late.psd")
+        service = RenameService()
+
+        assert service.validate_files([path]) == [(path, False, "File not found")]
+        make_file(src, "late.psd")
+        assert service.validate_files([path]) == [(path, True, "")]
+
+
+class TestRenameSession:
+    """Tests for RenameSession counters"""
+
+    def test_add_record_updates_counts(self):
+        """Test success and error counts follow added records"""
+        session = RenameSession(id="1")
+        ok = RenameRecord.from_paths("/a/x.psd", "/b/y.psd", FileOperation.MOVE, "")
+        failed = RenameRecord.from_paths("/a/z.psd", "/b/w.psd", FileOperation.MOVE, "")
+        failed.success = False
+        session.add_record(ok)
+        session.add_record(failed)
+
+        assert session.success_count == 1
+        assert session.error_count == 1
+        assert session.records == [ok, failed]
+
+    def test_add_records_updates_counts(self):
+        """Test adding a list of records keeps order and counts"""
+        session = RenameSession(id="1")
+        records = [RenameRecord.from_paths(f"/a/{i}.psd", f"/b/{i}.psd", FileOperation.MOVE, "")
+                   for i in range(3)]
+        records[1].success = False
+        session.add_records(records)
+
+        assert session.records == records
+        assert session.success_count == 2
+        assert session.error_count == 1
+
+    def test_counts_for_initial_records(self):
+        """Test records passed to the constructor are counted"""
+        record = RenameRecord.from_paths("/a/x.psd", "/b/y.psd", FileOperation.MOVE, "")
+        session = RenameSession(id="1", records=[record])
+        assert session.success_count == 1
+        assert session.error_count == 0
+
+
+class TestUndoManager:
+    """Tests for UndoManager"""
+
+    def test_undo_and_redo(self, workdir):
+        """Test a rename can be undone and redone"""
+        src, dest = workdir
+        a = make_file(src, "a.psd")
+        undo_manager = UndoManager()
+        service = RenameService(undo_manager)
+        service.rename_files([{'path': a, 'new_name': "1_A_1.psd"}], str(dest), "1")
+
+        assert undo_manager.can_undo()
+        success, _, count = undo_manager.undo()
+        assert success and count == 1
+        assert os.path.exists(a)
+        assert not (dest / "1_A_1.psd").exists()
+
+        assert undo_manager.can_redo()
+        success, _, count = undo_manager.redo()
+        assert success and count == 1
+        assert not os.path.exists(a)
+        assert (dest / "1_A_1.psd").exists()
+
+    def test_record_during_undo_keeps_redo_clear(self, workdir, monkeypatch):
+        """Test a session recorded while an undo runs is not followed by a stale redo"""
+        src, dest = workdir
+        undo_manager = UndoManager()
+        service = RenameService(undo_manager)
+        service.rename_files([{'path': make_file(src, "a.psd"), 'new_name': "1_A.psd"}],
+                             str(dest), "1")
+        newer = RenameSession(id="newer")
+        move_file = services._move_file
+
+        def move_and_record(*args):
+            move_file(*args)
+            undo_manager.record_session(newer)
+
+        monkeypatch.setattr(services, "_move_file", move_and_record)
+        assert undo_manager.undo()[0]
+
+        assert not undo_manager.can_redo()
+        assert undo_manager._undo_stack[-1] is newer
+
+    def test_record_during_redo_stays_on_top(self, workdir, monkeypatch):
+        """Test a session recorded while a redo runs is undone before the redone one"""
+        src, dest = workdir
+        undo_manager = UndoManager()
+        service = RenameService(undo_manager)
+        service.rename_files([{'path': make_file(src, "a.psd"), 'new_name': "1_A.psd"}],
+                             str(dest), "1")
+        assert undo_manager.undo()[0]
+        newer = RenameSession(id="newer")
+        move_file = services._move_file
+
+        def move_and_record(*args):
+            move_file(*args)
+            undo_manager.record_session(newer)
+
+        monkeypatch.setattr(services, "_move_file", move_and_record)
+        assert undo_manager.redo()[0]
+
+        assert [s.id for s in undo_manager._undo_stack][-1] == "newer"
+        assert len(undo_manager._undo_stack) == 2
+        assert not undo_manager.can_redo()
+
+    def test_nothing_to_undo(self):
+        """Test undo with empty history"""
+        success, message, count = UndoManager().undo()
+        assert success == False
+        assert count == 0
+
+    def test_history_is_trimmed(self, workdir):
+        """Test undo history keeps at most max_history sessions"""
+        src, dest = workdir
+        undo_manager = UndoManager(max_history=2)
+        service = RenameService(undo_manager)
+        for i in range(3):
+            path = make_file(src, f"{i}.psd")
+            service.rename_files([{'path': path, 'new_name': f"1_{i}.psd"}], str(dest), "1")
+
+        assert undo_manager.undo()[0]
+        assert undo_manager.undo()[0]
+        assert not undo_manager.can_undo()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
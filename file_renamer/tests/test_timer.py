@@ -0,0 +1,277 @@
+"""Tests for TimerManager"""
+
+import sys
+import json
+import time
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from src import timer
+from src.timer import TimerManager, TimeLogEntry
+
+
+@pytest.fixture
+def log_dir():
+    """Temporary time log directory"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def make_manager(log_dir):
+    """Factory for TimerManagers that are closed after the test"""
+    managers = []
+
+    def make() -> TimerManager:
+        manager = TimerManager(log_dir)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.close()
+
+
+def make_entry(date: str = "2024-01-15", minutes: float = 30.0) -> TimeLogEntry:
+    """Create a log entry for a given date"""
+    return TimeLogEntry(
+        job_number="12345",
+        job_folder=None,
+        clock_in=f"{date}T09:00:00",
+        clock_out=f"{date}T09:30:00",
+        duration_minutes=minutes,
+        date=date,
+    )
+
+
+class TestClockInOut:
+    """Tests for clocking in and out"""
+
+    def test_clock_in_and_out(self, make_manager):
+        """Test a session is logged for today"""
+        manager = make_manager()
+        success, _ = manager.clock_in("12345")
+        assert success
+        assert manager.is_clocked_in
+
+        success, _, entry = manager.clock_out("done")
+        assert success
+        assert not manager.is_clocked_in
+        assert entry.job_number == "12345"
+        assert manager.get_today_entries() == [entry]
+
+    def test_clock_out_when_not_clocked_in(self, make_manager):
+        """Test clock out without clock in fails"""
+        success, _, entry = make_manager().clock_out()
+        assert not success
+        assert entry is None
+
+    def test_clock_in_requires_job(self, make_manager):
+        """Test clock in needs a job number"""
+        success, _ = make_manager().clock_in("")
+        assert not success
+
+
+class TestElapsedTime:
+    """Tests for elapsed time while clocked in"""
+
+    def test_not_clocked_in(self, make_manager):
+        """Test elapsed time is zero when not clocked in"""
+        manager = make_manager()
+        assert manager.get_elapsed_seconds() == 0.0
+        assert manager.get_elapsed_time() == "00:00:00"
+
+    def test_elapsed_uses_monotonic_clock(self, make_manager, monkeypatch):
+        """Test elapsed time is measured from the monotonic clock"""
+        manager = make_manager()
+        manager.clock_in("12345")
+        monkeypatch.setattr(timer.time, "monotonic", lambda: manager._mono_in + 3661.5)
+
+        assert manager.get_elapsed_seconds() == pytest.approx(3661.5)
+        assert manager.get_elapsed_time() == "01:01:01"
+
+
+class TestLogBatching:
+    """Tests for batched background log writes"""
+
+    def test_clock_out_writes_entry(self, log_dir, make_manager, monkeypatch):
+        """Test clock out doesn't wait out the batch window and writes its entry"""
+        monkeypatch.setattr(timer, "BATCH_MS", 60_000)
+        manager = make_manager()
+        manager.clock_in("12345")
+
+        start = time.monotonic()
+        success, message, _ = manager.clock_out()
+        assert time.monotonic() - start < 5
+        assert success and "could not be saved" not in message
+        assert len(list(log_dir.iterdir())) == 1
+
+    def test_clock_out_reports_failed_write(self, make_manager, monkeypatch):
+        """Test a failed log write is reported instead of faking success"""
+        manager = make_manager()
+        monkeypatch.setattr(manager, "_write_entries", lambda date_str, entries: False)
+        manager.clock_in("12345")
+
+        success, message, _ = manager.clock_out()
+        assert success
+        assert "could not be saved" in message
+        assert not manager._save_log_entry(make_entry())
+
+    def test_full_batch_is_written(self, log_dir, make_manager, monkeypatch):
+        """Test entries are written once the batch is full"""
+        monkeypatch.setattr(timer, "BATCH_SIZE", 3)
+        monkeypatch.setattr(timer, "BATCH_MS", 60_000)
+        manager = make_manager()
+
+        manager._queue_log_entry(make_entry())
+        manager._queue_log_entry(make_entry())
+        assert not list(log_dir.iterdir())
+
+        manager._queue_log_entry(make_entry())
+        manager._queue.join()
+        lines = (log_dir / "timelog_2024-01-15.jsonl").read_text().splitlines()
+        assert len(lines) == 3
+
+    def test_reads_include_pending_entries(self, make_manager, monkeypatch):
+        """Test reading a date writes queued entries first without waiting out the batch"""
+        monkeypatch.setattr(timer, "BATCH_MS", 60_000)
+        manager = make_manager()
+
+        manager._queue_log_entry(make_entry(minutes=10))
+        manager._queue_log_entry(make_entry(minutes=20))
+
+        start = time.monotonic()
+        entries = manager.get_entries_for_date("2024-01-15")
+        assert [e.duration_minutes for e in entries] == [10, 20]
+        assert time.monotonic() - start < 5
+
+
+class TestClose:
+    """Tests for stopping the background writer"""
+
+    def test_close_writes_pending_and_stops_writer(self, log_dir, monkeypatch):
+        """Test close writes queued entries and ends the writer thread"""
+        monkeypatch.setattr(timer, "BATCH_MS", 60_000)
+        manager = TimerManager(log_dir)
+        writer = manager._writer
+        manager._queue_log_entry(make_entry())
+
+        manager.close()
+
+        assert not writer.is_alive()
+        assert len((log_dir / "timelog_2024-01-15.jsonl").read_text().splitlines()) == 1
+
+    def test_save_after_close_writes_directly(self, log_dir):
+        """Test entries saved after close are still written"""
+        manager = TimerManager(log_dir)
+        manager.close()
+        manager.close()  # closing twice is harmless
+
+        assert manager._save_log_entry(make_entry())
+        assert len(manager.get_entries_for_date("2024-01-15")) == 1
+
+
+class TestBatchSettings:
+    """Tests for the TIMER_BATCH_* environment settings"""
+
+    def test_invalid_value_uses_default(self, monkeypatch):
+        """Test a malformed value falls back to the default"""
+        monkeypatch.setenv("TIMER_BATCH_SIZE", "ten")
+        assert timer._env_int("TIMER_BATCH_SIZE", 10) == 10
+
+    def test_value_is_at_least_one(self, monkeypatch):
+        """Test zero or negative values are clamped"""
+        monkeypatch.setenv("TIMER_BATCH_MS", "-5")
+        assert timer._env_int("TIMER_BATCH_MS", 500) == 1
+
+
+class TestLogFormat:
+    """Tests for the JSON Lines log format"""
+
+    def test_one_entry_per_line(self, log_dir, make_manager):
+        """Test entries are appended as single lines"""
+        manager = make_manager()
+        manager._write_entries("2024-01-15", [make_entry().to_dict()])
+        manager._write_entries("2024-01-15", [make_entry(minutes=5).to_dict()])
+
+        lines = (log_dir / "timelog_2024-01-15.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["duration_minutes"] == 5
+
+    def test_unicode_notes_round_trip(self, log_dir, make_manager):
+        """Test non-ASCII notes are written unescaped and read back"""
+        manager = make_manager()
+        entry = make_entry()
+        entry.notes = "Café proof ✓"
+        manager._write_entries("2024-01-15", [entry.to_dict()])
+
+        text = (log_dir / "timelog_2024-01-15.jsonl").read_text(encoding="utf-8")
+        assert "Café proof ✓" in text
+        assert manager.get_entries_for_date("2024-01-15")[0].notes == "Café proof ✓"
+
+    def test_skips_bad_lines(self, log_dir, make_manager):
+        """Test a truncated or corrupt line doesn't hide the other entries"""
+        good = json.dumps(make_entry(minutes=10).to_dict())
+        (log_dir / "timelog_2024-01-15.jsonl").write_text(
+            f'{good}\n{{"job_number": "1", "dur\n[1, 2]\n{good}\n')
+        manager = make_manager()
+
+        entries = manager.get_entries_for_date("2024-01-15")
+        assert [e.duration_minutes for e in entries] == [10, 10]
+        assert manager.sum_durations_for_date("2024-01-15") == 20
+
+    def test_migrates_legacy_array_log(self, log_dir, make_manager):
+        """Test an older JSON array log is converted on first read"""
+        legacy = log_dir / "timelog_2024-01-15.json"
+        legacy.write_text(json.dumps([make_entry(minutes=10).to_dict()], indent=2))
+        manager = make_manager()
+        manager._write_entries("2024-01-15", [make_entry(minutes=20).to_dict()])
+
+        entries = manager.get_entries_for_date("2024-01-15")
+        assert [e.duration_minutes for e in entries] == [10, 20]
+        assert not legacy.exists()
+
+
+class TestSumDurations:
+    """Tests for TimerManager.sum_durations_for_date"""
+
+    def test_sums_minutes(self, make_manager):
+        """Test durations for a date are added up"""
+        manager = make_manager()
+        manager._write_entries("2024-01-15", [make_entry(minutes=10.5).to_dict(),
+                                              make_entry(minutes=20).to_dict()])
+        assert manager.sum_durations_for_date("2024-01-15") == 30.5
+
+    def test_missing_date(self, make_manager):
+        """Test a date without a log sums to zero"""
+        assert make_manager().sum_durations_for_date("2024-01-15") == 0.0
+
+
+class TestEntryCache:
+    """Tests for cached log reads"""
+
+    def test_repeated_reads_use_cache(self, make_manager, monkeypatch):
+        """Test an unchanged log file is parsed only once"""
+        manager = make_manager()
+        manager._write_entries("2024-01-15", [make_entry().to_dict()])
+        first = manager.get_entries_for_date("2024-01-15")
+
+        monkeypatch.setattr(TimeLogEntry, "from_dict",
+                            classmethod(lambda cls, data: pytest.fail("log was re-parsed")))
+        assert manager.get_entries_for_date("2024-01-15") == first
+
+    def test_writes_invalidate_cache(self, make_manager):
+        """Test new entries show up after a write"""
+        manager = make_manager()
+        manager._write_entries("2024-01-15", [make_entry().to_dict()])
+        assert len(manager.get_entries_for_date("2024-01-15")) == 1
+
+        manager._write_entries("2024-01-15", [make_entry().to_dict()])
+        assert len(manager.get_entries_for_date("2024-01-15")) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -110,6 +110,16 @@ class TestGetUniquePath:
             assert result != path
             assert "file_1.txt" in str(result)
 
+    def test_skips_taken_numbers(self):
+        """Test the first free number is used"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.txt"
+            for name in ("file.txt", "file_1.txt", "file_2.txt"):
+                (Path(tmpdir) / name).touch()
+            
+            result = get_unique_path(path)
+            assert result == Path(tmpdir) / "file_3.txt"
+
 
 class TestParseDroppedFiles:
     """Tests for parse_dropped_files function"""
@@ -141,6 +151,30 @@ class TestParseDroppedFiles:
             
             assert len(result) == 1
 
+    def test_mixed_braced_and_plain_paths(self):
+        """Test braced and plain paths are returned in drop order"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain = Path(tmpdir) / "plain.txt"
+            spaced = Path(tmpdir) / "with space.txt"
+            plain.touch()
+            spaced.touch()
+            
+            data = f"{plain} {{{spaced}}}"
+            result = parse_dropped_files(data)
+            
+            assert result == [str(plain), str(spaced)]
+
+    def test_removes_duplicates(self):
+        """Test a path dropped twice is returned once"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file1 = Path(tmpdir) / "file1.txt"
+            file1.touch()
+            
+            data = f"{file1} {file1}"
+            result = parse_dropped_files(data)
+            
+            assert result == [str(file1)]
+
     def test_filters_nonexistent(self):
         """Test that non-existent files are filtered out"""
         data = "/nonexistent/path/file.txt /another/fake/path.txt"